@@ -10,9 +10,12 @@ Usage:
 """
 import json
 import logging
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Any
 
+import numpy as np
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,6 +23,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compact integer codes for per-language validation statuses
+STATUS_CODES = {"pass": 0, "warn": 1, "fail": 2}
+UNKNOWN_STATUS_CODE = -1
+
 
 def load_validation_results(path: Path) -> Dict:
     """Load validation results from JSON file."""
@@ -40,39 +47,30 @@ def calculate_pass_rate_by_language(results: Dict) -> Dict[str, Dict[str, int]]:
     Returns:
         Dict mapping language codes to counts: {lang: {pass: N, warn: N, fail: N}}
     """
-    lang_stats = {}
+    status_counts = Counter(
+        (lang_code, lang_data.get("status", "UNKNOWN").lower())
+        for film_slug, film_data in results.items()
+        if not (film_slug.startswith("_") or film_slug == "film1")
+        for lang_code, lang_data in film_data.get("per_language", {}).items()
+    )
     
-    for film_slug, film_data in results.items():
-        if film_slug.startswith("_") or film_slug == "film1":
-            continue
+    lang_stats: Dict[str, Dict[str, int]] = {}
+    
+    for (lang_code, status), count in status_counts.items():
+        stats = lang_stats.setdefault(lang_code, {"pass": 0, "warn": 0, "fail": 0, "total": 0})
         
-        per_lang = film_data.get("per_language", {})
+        # Unknown statuses only count toward the total
+        if status in STATUS_CODES:
+            stats[status] += count
         
-        for lang_code, lang_data in per_lang.items():
-            if lang_code not in lang_stats:
-                lang_stats[lang_code] = {"pass": 0, "warn": 0, "fail": 0, "total": 0}
-            
-            status = lang_data.get("status", "UNKNOWN").lower()
-            
-            if status == "pass":
-                lang_stats[lang_code]["pass"] += 1
-            elif status == "warn":
-                lang_stats[lang_code]["warn"] += 1
-            elif status == "fail":
-                lang_stats[lang_code]["fail"] += 1
-            
-            lang_stats[lang_code]["total"] += 1
+        stats["total"] += count
     
     return lang_stats
 
 
 def calculate_overall_stats(results: Dict) -> Dict[str, Any]:
     """Calculate overall validation statistics."""
-    total_files = 0
-    pass_count = 0
-    warn_count = 0
-    fail_count = 0
-    
+    status_codes = []
     timing_drifts = []
     
     for film_slug, film_data in results.items():
@@ -82,22 +80,22 @@ def calculate_overall_stats(results: Dict) -> Dict[str, Any]:
         per_lang = film_data.get("per_language", {})
         
         for lang_data in per_lang.values():
-            total_files += 1
-            
             status = lang_data.get("status", "UNKNOWN").lower()
             drift = lang_data.get("timing_drift_percent")
             
-            if status == "pass":
-                pass_count += 1
-            elif status == "warn":
-                warn_count += 1
-            elif status == "fail":
-                fail_count += 1
-            
-            if drift is not None:
-                timing_drifts.append(drift)
+            status_codes.append(STATUS_CODES.get(status, UNKNOWN_STATUS_CODE))
+            timing_drifts.append(np.nan if drift is None else drift)
+    
+    statuses = np.array(status_codes, dtype=np.int8)
+    drifts = np.array(timing_drifts, dtype=np.float64)
+    
+    total_files = len(statuses)
+    pass_count = int(np.count_nonzero(statuses == STATUS_CODES["pass"]))
+    warn_count = int(np.count_nonzero(statuses == STATUS_CODES["warn"]))
+    fail_count = int(np.count_nonzero(statuses == STATUS_CODES["fail"]))
     
-    avg_drift = sum(timing_drifts) / len(timing_drifts) if timing_drifts else 0
+    # nanmean warns on an all-NaN slice, so only call it when a drift exists
+    avg_drift = float(np.nanmean(drifts)) if np.any(~np.isnan(drifts)) else 0
     pass_rate = (pass_count / total_files * 100) if total_files > 0 else 0
     
     return {
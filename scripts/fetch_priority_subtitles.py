@@ -36,6 +36,7 @@ except ImportError:
     print("ERROR: requests library not found. Install with: pip install requests")
     sys.exit(1)
 
+from src.shared.slugs import title_to_slug
 
 # Configuration
 API_BASE_URL = "https://api.opensubtitles.com/api/v1"
@@ -522,7 +523,7 @@ def parse_batch_file(batch_file_path: Path) -> List[Dict[str, Any]]:
             continue
         
         # Convert film title to slug
-        film_slug = film_title.lower().replace(" ", "_").replace("'", "")
+        film_slug = title_to_slug(film_title)
         
         # Parse priority score
         try:
@@ -8,6 +8,7 @@ improvements for maximum ROI on cross-language emotion analysis.
 Usage:
     python scripts/identify_multi_language_targets.py
 """
+import functools
 import json
 import logging
 from dataclasses import dataclass
@@ -22,13 +23,21 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Featured films (Epic 5 showcase)
-FEATURED_FILMS = {
+FEATURED_FILMS = frozenset({
     "spirited_away",
     "princess_mononoke",
     "my_neighbor_totoro",
     "howls_moving_castle",
     "kikis_delivery_service",
-}
+})
+
+# Priority points by component (see prioritize_language_target)
+FEATURED_FILM_POINTS = 40
+STATUS_POINTS = {"FAIL": 30, "WARN": 20}
+
+# (threshold, points) tiers, highest threshold first; first tier exceeded wins
+TIMING_DRIFT_TIERS = ((5.0, 15), (2.0, 10))
+CROSS_LANG_DRIFT_TIERS = ((10.0, 10), (5.0, 5))
 
 # Non-English languages for emotion analysis
 TARGET_LANGUAGES = ["fr", "es", "nl", "ar"]
@@ -83,14 +92,18 @@ def calculate_cross_language_drift(film_data: Dict) -> float:
     """Calculate cross-language timing drift for a film."""
     per_lang = film_data.get("per_language", {})
     
-    durations = []
-    for lang in TARGET_LANGUAGES + ["en"]:
-        if lang in per_lang:
-            lang_data = per_lang[lang]
-            duration = lang_data.get("subtitle_duration")
-            if duration:
-                durations.append(duration)
+    durations = tuple(
+        duration
+        for lang in TARGET_LANGUAGES + ["en"]
+        if (duration := per_lang.get(lang, {}).get("subtitle_duration"))
+    )
     
+    return _drift_from_durations(durations)
+
+
+@functools.lru_cache(maxsize=4096)
+def _drift_from_durations(durations: Tuple[float, ...]) -> float:
+    """Max deviation from the mean duration, as a percentage (memoised)."""
     if len(durations) < 2:
         return 0.0
     
@@ -100,6 +113,11 @@ def calculate_cross_language_drift(film_data: Dict) -> float:
     return (max_deviation / avg_duration * 100) if avg_duration > 0 else 0.0
 
 
+def _tier_points(value: float, tiers: Tuple[Tuple[float, int], ...]) -> int:
+    """Return the points of the first tier whose threshold value exceeds."""
+    return next((points for threshold, points in tiers if value > threshold), 0)
+
+
 def prioritize_language_target(
     film_slug: str,
     language: str,
@@ -121,31 +139,14 @@ def prioritize_language_target(
     Returns:
         Priority score (0-100, higher = more urgent)
     """
-    score = 0
-    
-    # Featured film bonus
-    if film_slug in FEATURED_FILMS:
-        score += 40
-    
-    # Current status penalty
-    status = lang_data.get("status", "UNKNOWN")
-    if status == "FAIL":
-        score += 30
-    elif status == "WARN":
-        score += 20
-    
-    # Timing drift penalty
     drift = lang_data.get("timing_drift_percent", 0.0) or 0.0
-    if drift > 5.0:
-        score += 15
-    elif drift > 2.0:
-        score += 10
     
-    # Cross-language consistency penalty
-    if cross_lang_drift > 10.0:
-        score += 10
-    elif cross_lang_drift > 5.0:
-        score += 5
+    score = (
+        (FEATURED_FILM_POINTS if film_slug in FEATURED_FILMS else 0)
+        + STATUS_POINTS.get(lang_data.get("status", "UNKNOWN"), 0)
+        + _tier_points(drift, TIMING_DRIFT_TIERS)
+        + _tier_points(cross_lang_drift, CROSS_LANG_DRIFT_TIERS)
+    )
     
     return min(score, 100)  # Cap at 100
 
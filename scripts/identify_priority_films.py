@@ -8,12 +8,13 @@ to guide subtitle acquisition efforts for maximum ROI.
 Usage:
     python scripts/identify_priority_films.py
 """
+import heapq
 import json
 import logging
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Add src to path for potential future imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -163,20 +164,16 @@ def categorize_priority(priority_score: int, pass_rate: float) -> str:
         return "LOW"
 
 
-def analyze_validation_results(results: Dict) -> List[FilmValidationSummary]:
+def _iter_film_summaries(results: Dict) -> Iterator[FilmValidationSummary]:
     """
-    Analyze validation results and generate film summaries.
+    Lazily build a FilmValidationSummary for each film in the results.
 
     Args:
         results: Validation results dictionary
 
-    Returns:
-        List of FilmValidationSummary objects, sorted by priority score (descending)
+    Yields:
+        FilmValidationSummary objects in input order
     """
-    logger.info("Analyzing validation results and calculating priorities...")
-
-    summaries = []
-
     for film_slug, film_data in results.items():
         per_language = film_data.get("per_language", {})
         cross_language = film_data.get("cross_language", {})
@@ -195,7 +192,7 @@ def analyze_validation_results(results: Dict) -> List[FilmValidationSummary]:
         priority_score = calculate_priority_score(pass_rate, is_featured, cross_lang_drift)
         priority_category = categorize_priority(priority_score, pass_rate)
 
-        summary = FilmValidationSummary(
+        yield FilmValidationSummary(
             film_slug=film_slug,
             total_languages=len(per_language),
             languages_passed=passed,
@@ -209,13 +206,43 @@ def analyze_validation_results(results: Dict) -> List[FilmValidationSummary]:
             priority_category=priority_category,
         )
 
-        summaries.append(summary)
+
+def _priority_sort_key(summary: FilmValidationSummary) -> Tuple[int, float]:
+    """Sort key: priority score (descending), then pass rate (ascending)."""
+    return (-summary.priority_score, summary.pass_rate)
+
+
+def analyze_validation_results(
+    results: Dict,
+    top_k: Optional[int] = None,
+) -> List[FilmValidationSummary]:
+    """
+    Analyze validation results and generate film summaries.
+
+    Args:
+        results: Validation results dictionary
+        top_k: If set, only return the top_k highest-priority films. Selection
+            uses a bounded heap (O(N log k)) instead of sorting every summary.
+
+    Returns:
+        List of FilmValidationSummary objects, sorted by priority score (descending)
+    """
+    logger.info("Analyzing validation results and calculating priorities...")
+
+    summaries = _iter_film_summaries(results)
+
+    if top_k is not None:
+        # nsmallest on the composite key is equivalent to sorted(...)[:top_k]
+        # (including tie order) without materializing the full sorted list
+        top_summaries = heapq.nsmallest(top_k, summaries, key=_priority_sort_key)
+        logger.info(f"Selected top {len(top_summaries)} of {len(results)} films")
+        return top_summaries
 
     # Sort by priority score (descending), then by pass rate (ascending)
-    summaries.sort(key=lambda x: (-x.priority_score, x.pass_rate))
+    sorted_summaries = sorted(summaries, key=_priority_sort_key)
 
-    logger.info(f"Generated summaries for {len(summaries)} films")
-    return summaries
+    logger.info(f"Generated summaries for {len(sorted_summaries)} films")
+    return sorted_summaries
 
 
 def format_film_title(film_slug: str) -> str:
@@ -22,6 +22,8 @@ setup(
         "dev": [
             "pytest>=7.4.3",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
+            "pytest-testmon>=2.1.0",
             "black>=24.0.0",
             "flake8>=7.0.0",
             "mypy>=1.8.0",
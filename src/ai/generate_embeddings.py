@@ -120,7 +120,8 @@ def estimate_embedding_cost(documents: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     logger.info("Estimating embedding generation cost...")
 
-    total_tokens = sum(estimate_tokens(doc["text"]) for doc in documents)
+    # Corpus validation records each document's token count; only count the rest
+    total_tokens = sum(doc.get("_token_count") or estimate_tokens(doc["text"]) for doc in documents)
     estimated_cost = (total_tokens / 1_000_000) * COST_PER_MILLION_TOKENS
 
     cost_info = {
@@ -18,6 +18,7 @@ from langchain.tools import tool
 from scipy.stats import pearsonr
 
 from src.shared.database import get_duckdb_connection
+from src.shared.slugs import title_to_slug
 from src.validation.chart_utils import load_dialogue_excerpts
 import json
 import os
@@ -484,7 +485,7 @@ def get_film_sentiment(film_title: str, compact: bool = False) -> Dict[str, Any]
             ORDER BY minute_offset
         """
         # Match film slug pattern (e.g., "spirited_away_%")
-        film_slug_pattern = film_title.lower().replace(" ", "_").replace("'", "") + "_%"
+        film_slug_pattern = title_to_slug(film_title) + "_%"
         emotion_result = conn.execute(emotion_query, [film_slug_pattern]).fetchall()
 
         if not emotion_result:
@@ -1521,7 +1522,7 @@ def compare_sentiment_arcs_across_languages(
             )
 
         # Build film slug pattern
-        film_slug_base = film_title.lower().replace(" ", "_").replace("'", "")
+        film_slug_base = title_to_slug(film_title)
 
         # Query emotion data for all requested languages
         if emotion_dimension == "compound":
@@ -7,11 +7,16 @@ into embeddable documents for OpenAI's text-embedding-3-small model.
 """
 
 import argparse
+import functools
+import gzip
 import json
 import logging
+import sys
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 import duckdb
 import tiktoken
@@ -24,28 +29,71 @@ FILM_DESCRIPTION_MAX_TOKENS = 500
 QUOTES_PER_FILM = 50
 TOKEN_OVERLAP = 50
 EMBEDDING_MODEL = "text-embedding-3-small"
+# Private document key for a recorded exact token count; never saved
+TOKEN_COUNT_KEY = "_token_count"
+SUBTITLES_DIR = Path("data/processed/subtitles")
 
 # Logger
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.debug("orjson not available - corpus JSON will be read and written with stdlib json")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str = EMBEDDING_MODEL) -> Optional[tiktoken.Encoding]:
+    """
+    Return the tiktoken encoding for a model, or None if it cannot be loaded.
+
+    Cached either way, so a failed load (e.g. no network to download the
+    encoding) is attempted and logged once per process, not once per text.
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception as e:
+        logger.warning(f"tiktoken encoding failed: {e}, falling back to estimation")
+        return None
+
+
+@functools.lru_cache(maxsize=100_000)
+def _count_tokens(text: str, encoding: tiktoken.Encoding) -> int:
+    """Count tokens exactly with a loaded encoding (memoized per text)."""
+    return len(encoding.encode_ordinary(text))
+
 
 def estimate_tokens(text: str, model: str = EMBEDDING_MODEL) -> int:
     """
     Estimate token count for text using tiktoken.
 
+    Falls back to a UTF-8 byte estimate (~4 bytes per token) if the tiktoken
+    encoding cannot be loaded; byte length keeps the estimate from
+    undercounting Japanese text the way a character count would. Only exact
+    counts are memoized, never the fallback estimate.
+
     Args:
         text: Text to count tokens for
         model: OpenAI model name for encoding (default: text-embedding-3-small)
 
     Returns:
-        Integer token count
+        Integer token count (or rough estimate if tiktoken encoding fails)
 
     Example:
         >>> estimate_tokens("Hello world")
         2
     """
-    enc = tiktoken.encoding_for_model(model)
-    return len(enc.encode(text))
+    if not text:
+        return 0
+
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return _count_tokens(text, encoding)
+
+    # Fallback: rough estimation (~4 UTF-8 bytes per token)
+    return max(1, len(text.encode("utf-8")) // 4)
 
 
 def chunk_text(
@@ -62,28 +110,33 @@ def chunk_text(
     Returns:
         List of text chunks
 
+    Raises:
+        RuntimeError: If the tiktoken encoding cannot be loaded
+
     Example:
         >>> chunks = chunk_text("Long text...", max_tokens=100)
         >>> all(estimate_tokens(c) <= 100 for c in chunks)
         True
     """
-    enc = tiktoken.encoding_for_model(EMBEDDING_MODEL)
+    enc = _get_encoding()
+    if enc is None:
+        raise RuntimeError(f"tiktoken encoding for {EMBEDDING_MODEL} is unavailable")
     tokens = enc.encode(text)
 
     if len(tokens) <= max_tokens:
         return [text]
 
-    chunks = []
-    start = 0
+    # Tokenize once, then slide a max_tokens window with overlap for context
+    stride = max_tokens - overlap
+    return [
+        enc.decode(tokens[start : start + max_tokens])
+        for start in range(0, len(tokens), stride)
+    ]
 
-    while start < len(tokens):
-        end = start + max_tokens
-        chunk_tokens = tokens[start:end]
-        chunk_text = enc.decode(chunk_tokens)
-        chunks.append(chunk_text)
-        start = end - overlap  # Overlap for context
 
-    return chunks
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a low-cardinality metadata string so documents share one copy."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 def extract_film_documents(conn: duckdb.DuckDBPyConnection) -> List[Dict[str, Any]]:
@@ -132,7 +185,7 @@ def extract_film_documents(conn: duckdb.DuckDBPyConnection) -> List[Dict[str, An
                 "name": title,
                 "text": description,
                 "metadata": {
-                    "director": director,
+                    "director": _intern(director),
                     "release_year": int(release_year) if release_year else None,
                     "rt_score": int(rt_score) if rt_score else None,
                     "running_time": int(running_time) if running_time else None,
@@ -207,15 +260,15 @@ def extract_character_documents(conn: duckdb.DuckDBPyConnection) -> List[Dict[st
                 logger.debug(f"Chunked {name} into {len(chunks)} parts")
 
                 for chunk_num, chunk in enumerate(chunks, 1):
-                    doc = {
+                    doc: Dict[str, Any] = {
                         "doc_id": f"character_{char_id}_chunk{chunk_num}",
                         "type": "character",
                         "name": f"{name} (part {chunk_num})",
                         "text": chunk,
                         "metadata": {
-                            "gender": gender,
+                            "gender": _intern(gender),
                             "age": age,
-                            "species": species,
+                            "species": _intern(species),
                             "chunk_num": chunk_num,
                             "total_chunks": len(chunks),
                         },
@@ -230,11 +283,14 @@ def extract_character_documents(conn: duckdb.DuckDBPyConnection) -> List[Dict[st
                     "name": name,
                     "text": bio_text,
                     "metadata": {
-                        "gender": gender,
+                        "gender": _intern(gender),
                         "age": age,
-                        "species": species,
+                        "species": _intern(species),
                     },
                 }
+                # Keep the count for validate_corpus unless it is a fallback estimate
+                if _get_encoding() is not None:
+                    doc[TOKEN_COUNT_KEY] = token_count
                 documents.append(doc)
 
         logger.info(
@@ -296,8 +352,8 @@ def extract_location_documents(conn: duckdb.DuckDBPyConnection) -> List[Dict[str
                 "name": name,
                 "text": description,
                 "metadata": {
-                    "climate": climate,
-                    "terrain": terrain,
+                    "climate": _intern(climate),
+                    "terrain": _intern(terrain),
                     "surface_water_pct": surface_water_pct,
                 },
             }
@@ -360,7 +416,7 @@ def extract_species_documents(conn: duckdb.DuckDBPyConnection) -> List[Dict[str,
                 "name": name,
                 "text": description,
                 "metadata": {
-                    "classification": classification,
+                    "classification": _intern(classification),
                     "eye_colors": eye_colors,
                     "hair_colors": hair_colors,
                 },
@@ -375,6 +431,26 @@ def extract_species_documents(conn: duckdb.DuckDBPyConnection) -> List[Dict[str,
         return []
 
 
+# Independent per-table extractors; build_corpus runs them concurrently
+STRUCTURED_EXTRACTORS = (
+    extract_film_documents,
+    extract_character_documents,
+    extract_location_documents,
+    extract_species_documents,
+)
+
+
+def _load_subtitle_json(path: Path) -> Dict[str, Any]:
+    """Load a parsed subtitle JSON file (orjson when available)."""
+    data: Dict[str, Any]
+    if ORJSON_AVAILABLE:
+        data = orjson.loads(path.read_bytes())
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    return data
+
+
 def extract_memorable_quotes(
     conn: duckdb.DuckDBPyConnection, max_quotes_per_film: int = QUOTES_PER_FILM
 ) -> List[Dict[str, Any]]:
@@ -443,6 +519,7 @@ def extract_memorable_quotes(
 
         documents = []
         film_count = set()
+        subtitle_cache: Dict[str, Optional[Dict[str, Any]]] = {}
 
         for row in results:
             (
@@ -460,17 +537,21 @@ def extract_memorable_quotes(
 
             # Load corresponding subtitle file
             # Note: film_slug already contains language code (e.g., "spirited_away_en")
-            subtitle_path = Path(
-                f"data/processed/subtitles/{film_slug}_parsed.json"
-            )
-
-            if not subtitle_path.exists():
-                logger.warning(f"Subtitle file not found: {subtitle_path}")
-                continue
+            subtitle_path = SUBTITLES_DIR / f"{film_slug}_parsed.json"
 
             try:
-                with open(subtitle_path) as f:
-                    subtitle_data = json.load(f)
+                # Load each film's subtitle file once and reuse it for all of
+                # that film's emotional peaks
+                if film_slug not in subtitle_cache:
+                    if subtitle_path.exists():
+                        subtitle_cache[film_slug] = _load_subtitle_json(subtitle_path)
+                    else:
+                        logger.warning(f"Subtitle file not found: {subtitle_path}")
+                        subtitle_cache[film_slug] = None
+
+                subtitle_data = subtitle_cache[film_slug]
+                if subtitle_data is None:
+                    continue
 
                 # Extract dialogue from the minute bucket
                 minute_start = minute_offset * 60  # Convert to seconds
@@ -536,6 +617,44 @@ def extract_memorable_quotes(
         return []
 
 
+def build_corpus(
+    conn: duckdb.DuckDBPyConnection, max_workers: int = len(STRUCTURED_EXTRACTORS)
+) -> List[Dict[str, Any]]:
+    """
+    Extract film, character, location and species documents concurrently.
+
+    Each extractor runs in its own thread on its own cursor (DuckDB
+    connections are not shared across threads). Documents are returned in
+    the same order as running the extractors one after another.
+
+    Args:
+        conn: Active DuckDB connection
+        max_workers: Thread pool size (default: one thread per extractor)
+
+    Returns:
+        Film, character, location and species documents, in that order
+
+    Example:
+        >>> docs = build_corpus(conn)
+        >>> docs[0]["type"]
+        'film'
+    """
+
+    def run_extractor(
+        extractor: Callable[[duckdb.DuckDBPyConnection], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        cursor = conn.cursor()
+        try:
+            return extractor(cursor)
+        finally:
+            cursor.close()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(run_extractor, STRUCTURED_EXTRACTORS))
+
+    return [doc for documents in results for doc in documents]
+
+
 def validate_corpus(documents: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Validate corpus and generate statistics.
@@ -543,8 +662,14 @@ def validate_corpus(documents: List[Dict[str, Any]]) -> Dict[str, Any]:
     Checks document structure, calculates distribution metrics, and
     validates expected ranges.
 
+    Mutates its input: when the tiktoken encoding is available, each
+    document's exact token count is stored under the private
+    ``_token_count`` key so later passes (re-validation, embedding cost
+    estimates) reuse it instead of tokenizing again. Fallback estimates are
+    never stored, and the save functions leave the key out.
+
     Args:
-        documents: List of all extracted documents
+        documents: List of all extracted documents (token counts added in place)
 
     Returns:
         Dictionary with validation statistics
@@ -556,27 +681,46 @@ def validate_corpus(documents: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     total = len(documents)
 
-    # Distribution by type
-    type_distribution = Counter([doc["type"] for doc in documents])
-
-    # Average text length per type
-    avg_length_by_type = {}
-    avg_tokens_by_type = {}
-
-    for doc_type in type_distribution.keys():
-        docs_of_type = [doc for doc in documents if doc["type"] == doc_type]
-        text_lengths = [len(doc["text"]) for doc in docs_of_type]
-        token_counts = [estimate_tokens(doc["text"]) for doc in docs_of_type]
+    # Pull the type and text columns out once with C-level getters
+    types = list(map(itemgetter("type"), documents))
+    texts = list(map(itemgetter("text"), documents))
 
-        avg_length_by_type[doc_type] = (
-            sum(text_lengths) / len(text_lengths) if text_lengths else 0
-        )
-        avg_tokens_by_type[doc_type] = (
-            sum(token_counts) / len(token_counts) if token_counts else 0
-        )
+    # Distribution by type
+    type_distribution = Counter(types)
+
+    # Reuse token counts recorded by an extractor or an earlier pass; count
+    # the rest in one batched tiktoken call and record them on each document
+    token_counts: List[Any] = [doc.get(TOKEN_COUNT_KEY) for doc in documents]
+    missing = [i for i, count in enumerate(token_counts) if count is None]
+    missing_texts = [texts[i] for i in missing]
+    encoding = _get_encoding() if missing_texts else None
+    counts_are_exact = encoding is not None
+    if encoding is not None:
+        new_counts = [len(tokens) for tokens in encoding.encode_ordinary_batch(missing_texts)]
+    else:
+        # No encoding: byte estimates, used for the statistics but not persisted
+        new_counts = [estimate_tokens(text) for text in missing_texts]
+    for i, count in zip(missing, new_counts):
+        token_counts[i] = count
+        if counts_are_exact:
+            documents[i][TOKEN_COUNT_KEY] = count
+
+    # Average text length and token count per type, accumulated in one pass
+    length_totals: Counter = Counter()
+    token_totals: Counter = Counter()
+    for doc_type, text, token_count in zip(types, texts, token_counts):
+        length_totals[doc_type] += len(text)
+        token_totals[doc_type] += token_count
+
+    avg_length_by_type = {
+        doc_type: length_totals[doc_type] / count for doc_type, count in type_distribution.items()
+    }
+    avg_tokens_by_type = {
+        doc_type: token_totals[doc_type] / count for doc_type, count in type_distribution.items()
+    }
 
     # Check for empty text
-    empty_count = len([d for d in documents if not d.get("text", "").strip()])
+    empty_count = sum(1 for text in texts if not text.strip())
 
     # Check expected range (100-200 documents per story requirements)
     in_expected_range = 100 <= total <= 2000  # Adjusted for quotes
@@ -593,15 +737,21 @@ def validate_corpus(documents: List[Dict[str, Any]]) -> Dict[str, Any]:
     return validation
 
 
-def save_corpus_to_json(documents: List[Dict[str, Any]], output_path: str) -> None:
+def _public_fields(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop private bookkeeping keys (leading underscore) before saving a document."""
+    return {key: value for key, value in document.items() if not key.startswith("_")}
+
+
+def save_corpus_to_json(documents: List[Dict[str, Any]], output_path: Union[str, Path]) -> None:
     """
     Save corpus to JSON file.
 
     Creates output directory if needed and writes documents with formatting.
+    Private keys such as ``_token_count`` are left out.
 
     Args:
         documents: List of all documents to save
-        output_path: Path to output JSON file
+        output_path: Path to output JSON file (str or Path)
 
     Raises:
         IOError: If file write fails
@@ -615,8 +765,15 @@ def save_corpus_to_json(documents: List[Dict[str, Any]], output_path: str) -> No
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(documents, f, indent=2, ensure_ascii=False)
+        # Serialise in one call and write once; orjson emits UTF-8 (like
+        # ensure_ascii=False) with the same 2-space layout
+        public_documents = [_public_fields(doc) for doc in documents]
+        if ORJSON_AVAILABLE:
+            output_file.write_bytes(orjson.dumps(public_documents, option=orjson.OPT_INDENT_2))
+        else:
+            output_file.write_text(
+                json.dumps(public_documents, indent=2, ensure_ascii=False), encoding="utf-8"
+            )
 
         logger.info(f"Saved {len(documents)} documents to {output_path}")
 
@@ -625,6 +782,57 @@ def save_corpus_to_json(documents: List[Dict[str, Any]], output_path: str) -> No
         raise
 
 
+def save_corpus_to_jsonl(
+    documents: Iterable[Dict[str, Any]], output_path: Union[str, Path]
+) -> None:
+    """
+    Save corpus as JSON Lines (one compact document per line).
+
+    Lets consumers stream documents instead of loading the whole array.
+    Private keys such as ``_token_count`` are left out.
+    Paths ending in ``.gz`` are gzip-compressed. The file is written to a
+    temporary sibling and renamed on success, so readers never see a
+    partial corpus.
+
+    Args:
+        documents: Documents to save; any iterable, so a generator is
+            written without first being materialized
+        output_path: Path to output .jsonl (or .jsonl.gz) file (str or Path)
+
+    Raises:
+        IOError: If file write fails
+
+    Example:
+        >>> save_corpus_to_jsonl(docs, "data/processed/corpus.jsonl.gz")
+    """
+    output_file = Path(output_path)
+    temp_file = output_file.with_name(output_file.name + ".tmp")
+
+    # Create directory if needed
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    opener = gzip.open if output_file.suffix == ".gz" else open
+
+    count = 0
+    try:
+        with opener(temp_file, "wb") as f:
+            for doc in map(_public_fields, documents):
+                count += 1
+                if ORJSON_AVAILABLE:
+                    f.write(orjson.dumps(doc) + b"\n")
+                else:
+                    line = json.dumps(doc, ensure_ascii=False, separators=(",", ":"))
+                    f.write(line.encode("utf-8") + b"\n")
+        temp_file.replace(output_file)
+
+        logger.info(f"Saved {count} documents to {output_path}")
+
+    except Exception as e:
+        logger.error(f"Failed to save corpus to {output_path}: {e}")
+        temp_file.unlink(missing_ok=True)
+        raise
+
+
 def main(
     output_path: str = "data/processed/embedding_corpus.json",
     max_quotes_per_film: int = QUOTES_PER_FILM,
@@ -633,7 +841,8 @@ def main(
     """
     Main orchestration function for corpus preparation.
 
-    Extracts all document types, validates corpus, and saves to JSON.
+    Extracts all document types, validates corpus, and saves to JSON
+    (or JSON Lines when output_path ends in .jsonl / .jsonl.gz).
 
     Args:
         output_path: Path to save corpus JSON (default: data/processed/embedding_corpus.json)
@@ -654,23 +863,14 @@ def main(
 
     try:
         # Extract all document types
-        logger.info("Extracting film documents...")
-        films = extract_film_documents(conn)
-
-        logger.info("Extracting character documents...")
-        characters = extract_character_documents(conn)
-
-        logger.info("Extracting location documents...")
-        locations = extract_location_documents(conn)
-
-        logger.info("Extracting species documents...")
-        species = extract_species_documents(conn)
+        logger.info("Extracting film, character, location and species documents...")
+        structured = build_corpus(conn)
 
         logger.info("Extracting memorable quotes...")
         quotes = extract_memorable_quotes(conn, max_quotes_per_film)
 
         # Combine all documents
-        all_documents = films + characters + locations + species + quotes
+        all_documents = structured + quotes
 
         # Validate corpus
         logger.info("Validating corpus...")
@@ -701,7 +901,10 @@ def main(
 
         # Save corpus
         logger.info(f"Saving corpus to {output_path}...")
-        save_corpus_to_json(all_documents, output_path)
+        if output_path.endswith((".jsonl", ".jsonl.gz")):
+            save_corpus_to_jsonl(all_documents, output_path)
+        else:
+            save_corpus_to_json(all_documents, output_path)
 
         logger.info("Corpus preparation completed successfully!")
 
@@ -721,7 +924,10 @@ if __name__ == "__main__":
         "--output",
         type=str,
         default="data/processed/embedding_corpus.json",
-        help="Output path for corpus JSON (default: data/processed/embedding_corpus.json)",
+        help=(
+            "Output path for corpus JSON; .jsonl or .jsonl.gz writes JSON Lines "
+            "(default: data/processed/embedding_corpus.json)"
+        ),
     )
     parser.add_argument(
         "--max-quotes-per-film",
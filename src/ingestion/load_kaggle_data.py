@@ -11,13 +11,14 @@ Example:
 """
 
 import argparse
+import functools
 import json
 import logging
 import os
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 
 import pandas as pd
 
@@ -56,11 +57,28 @@ KNOWN_EXCLUSIONS = {
     }
 }
 
+# Title normalization patterns (compiled once at import)
+TRAILING_PAREN_YEAR_PATTERN = re.compile(r"\s*\(\d{4}\)\s*$")
+TRAILING_YEAR_PATTERN = re.compile(r"\s+\d{4}\s*$")
+
+# Special characters that cause title mismatches → ASCII equivalents (ä→a, é→e, etc.)
+# Applied after lowercasing, so only lowercase keys are needed.
+SPECIAL_CHAR_MAP = str.maketrans({
+    'ä': 'a', 'ö': 'o', 'ü': 'u',
+    'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
+    'à': 'a', 'â': 'a', 'á': 'a', 'ã': 'a', 'å': 'a',
+    'î': 'i', 'ï': 'i', 'í': 'i', 'ì': 'i',
+    'ó': 'o', 'ò': 'o', 'ô': 'o', 'õ': 'o', 'ø': 'o',
+    'ú': 'u', 'ù': 'u', 'û': 'u',
+    'ç': 'c', 'ñ': 'n', 'ß': 'ss',
+    'æ': 'ae', 'œ': 'oe',
+})
+
 # Logger
 logger = logging.getLogger(__name__)
 
 
-def load_kaggle_csv(file_path: str) -> pd.DataFrame:
+def load_kaggle_csv(file_path: str, schema: bool = False) -> pd.DataFrame:
     """
     Load Kaggle Studio Ghibli Films CSV with encoding handling.
 
@@ -69,6 +87,8 @@ def load_kaggle_csv(file_path: str) -> pd.DataFrame:
 
     Args:
         file_path: Path to Kaggle CSV file
+        schema: If True, convert Year/Budget/Revenue while parsing so that
+            convert_data_types() has nothing left to do for those columns
 
     Returns:
         DataFrame with raw CSV data
@@ -93,9 +113,16 @@ def load_kaggle_csv(file_path: str) -> pd.DataFrame:
     encodings = ["utf-8", "latin-1", "cp1252"]
     logger.info(f"Loading Kaggle CSV from {file_path}")
 
+    # Fuse type conversion into the parse (missing/invalid values → 0)
+    converters = (
+        {"Year": safe_int_convert, "Budget": clean_currency, "Revenue": clean_currency}
+        if schema
+        else None
+    )
+
     for encoding in encodings:
         try:
-            df = pd.read_csv(file_path, encoding=encoding)
+            df = pd.read_csv(file_path, encoding=encoding, converters=converters)
             logger.info(f"✓ Loaded {len(df)} films from Kaggle CSV (encoding: {encoding})")
             return df
         except UnicodeDecodeError:
@@ -205,6 +232,38 @@ def clean_currency(value: Any) -> float:
         return 0.0
 
 
+def clean_currency_series(values: pd.Series) -> pd.Series:
+    """
+    Vectorized clean_currency for a whole column.
+
+    Strips $, commas and spaces with pandas string ops and converts in one
+    pd.to_numeric pass instead of calling clean_currency per value.
+    Missing, empty, "Unknown" and unparseable values become 0.0.
+
+    Args:
+        values: Series of currency strings or numbers
+
+    Returns:
+        float64 Series of cleaned values
+    """
+    cleaned = (
+        values.astype(str)
+        .str.replace("$", "", regex=False)
+        .str.replace(",", "", regex=False)
+        .str.strip()
+    )
+    numeric = pd.to_numeric(cleaned, errors="coerce")
+
+    invalid = numeric.isna() & values.notna() & ~values.isin(["", "Unknown"])
+    if invalid.any():
+        logger.warning(
+            f"Could not convert {int(invalid.sum())} value(s) in '{values.name}' to float, "
+            f"using 0.0: {values[invalid].tolist()}"
+        )
+
+    return numeric.fillna(0.0).astype("float64")
+
+
 def safe_int_convert(value: Any, default: int = 0) -> int:
     """
     Convert value to int with fallback to default.
@@ -226,6 +285,11 @@ def safe_int_convert(value: Any, default: int = 0) -> int:
         return default
 
 
+def _is_clean_float(values: pd.Series) -> bool:
+    """Return True if a column is already float64 with no missing values."""
+    return values.dtype == "float64" and not values.isna().any()
+
+
 def convert_data_types(df: pd.DataFrame) -> pd.DataFrame:
     """
     Convert DataFrame columns to appropriate data types.
@@ -240,19 +304,21 @@ def convert_data_types(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with proper types
     """
+    # Columns already typed at load time (load_kaggle_csv(schema=True)) are skipped
+
     # Convert Year to integer
-    if "Year" in df.columns:
+    if "Year" in df.columns and df["Year"].dtype != "int64":
         df["Year"] = df["Year"].apply(safe_int_convert)
         logger.debug(f"✓ Converted Year to int")
 
     # Convert Budget to float (clean currency)
-    if "Budget" in df.columns:
-        df["Budget"] = df["Budget"].apply(clean_currency)
+    if "Budget" in df.columns and not _is_clean_float(df["Budget"]):
+        df["Budget"] = clean_currency_series(df["Budget"])
         logger.debug(f"✓ Converted Budget to float")
 
     # Convert Revenue to float (clean currency)
-    if "Revenue" in df.columns:
-        df["Revenue"] = df["Revenue"].apply(clean_currency)
+    if "Revenue" in df.columns and not _is_clean_float(df["Revenue"]):
+        df["Revenue"] = clean_currency_series(df["Revenue"])
         logger.debug(f"✓ Converted Revenue to float")
 
     logger.info(f"✓ Data type conversions completed")
@@ -291,29 +357,48 @@ def normalize_title(title: str) -> str:
     normalized = " ".join(str(title).split())
 
     # Step 2: Remove year in parentheses at the end: "(2001)"
-    normalized = re.sub(r'\s*\(\d{4}\)\s*$', '', normalized)
+    normalized = TRAILING_PAREN_YEAR_PATTERN.sub('', normalized)
 
     # Step 3: Remove standalone year at the end
     # Matches patterns like "Ocean Waves 1994" after removing newlines
-    normalized = re.sub(r'\s+\d{4}\s*$', '', normalized)
+    normalized = TRAILING_YEAR_PATTERN.sub('', normalized)
 
     # Step 4: Convert to lowercase
     normalized = normalized.lower()
 
     # Step 5: Remove common special characters that cause mismatches
-    # Replace special chars with ASCII equivalents: ä→a, é→e, etc.
-    special_char_map = str.maketrans({
-        'ä': 'a', 'ö': 'o', 'ü': 'u',
-        'é': 'e', 'è': 'e', 'ê': 'e',
-        'à': 'a', 'â': 'a',
-        'î': 'i', 'ï': 'i',
-        'ç': 'c',
-    })
-    normalized = normalized.translate(special_char_map)
+    normalized = normalized.translate(SPECIAL_CHAR_MAP)
 
     return normalized.strip()
 
 
+@functools.lru_cache(maxsize=1)
+def _load_api_titles(
+    api_films_path: str, mtime: float
+) -> Tuple[Dict[str, str], FrozenSet[str]]:
+    """
+    Load Ghibli API films and map normalized titles to original titles.
+
+    Cached per (path, modification time) so repeated cross-references in one
+    process parse and normalize the API cache only once, while edits to the
+    file are still picked up. Callers must treat the result as read-only.
+
+    Args:
+        api_films_path: Path to the Ghibli API films.json cache
+        mtime: Modification time of the file (part of the cache key)
+
+    Returns:
+        Tuple of (normalized title → original API title, frozenset of normalized titles)
+    """
+    logger.info(f"Loading Ghibli API films from {api_films_path}")
+
+    with open(api_films_path, "r", encoding="utf-8") as f:
+        api_films = json.load(f)
+
+    api_titles = {normalize_title(film["title"]): film["title"] for film in api_films}
+    return api_titles, frozenset(api_titles)
+
+
 def cross_reference_with_ghibli_api(kaggle_df: pd.DataFrame) -> Dict[str, Any]:
     """
     Cross-reference Kaggle titles with Ghibli API films.
@@ -345,24 +430,20 @@ def cross_reference_with_ghibli_api(kaggle_df: pd.DataFrame) -> Dict[str, Any]:
             f"Run Story 1.2 (fetch_ghibli_api.py) first."
         )
 
-    logger.info(f"Loading Ghibli API films from {API_FILMS_PATH}")
-
-    with open(API_FILMS_PATH, "r", encoding="utf-8") as f:
-        api_films = json.load(f)
-
     # Normalize titles for comparison
-    api_titles = {normalize_title(film["title"]): film["title"] for film in api_films}
+    api_titles, api_keys = _load_api_titles(API_FILMS_PATH, os.path.getmtime(API_FILMS_PATH))
     kaggle_titles = {
         normalize_title(title): title for title in kaggle_df["Name"]
     }
+    kaggle_keys = frozenset(kaggle_titles)
 
-    # Step 1: Direct matches after normalization
-    matched = set(api_titles.keys()) & set(kaggle_titles.keys())
+    # Step 1: Direct matches after normalization (hash join on normalized titles)
+    matched = set(api_keys & kaggle_keys)
 
     # Step 2: Apply title variations mapping for known cases
     variations_used = 0
-    kaggle_remaining = set(kaggle_titles.keys()) - matched
-    api_remaining = set(api_titles.keys()) - matched
+    kaggle_remaining = set(kaggle_keys - matched)
+    api_remaining = set(api_keys - matched)
 
     for kaggle_norm, api_norm in TITLE_VARIATIONS.items():
         if kaggle_norm in kaggle_remaining and api_norm in api_remaining:
@@ -459,8 +540,8 @@ def main() -> None:
     5. Cross-reference with API
     6. Save cleaned data
     """
-    # Load CSV
-    df = load_kaggle_csv(DEFAULT_INPUT_PATH)
+    # Load CSV (numeric columns converted during parse)
+    df = load_kaggle_csv(DEFAULT_INPUT_PATH, schema=True)
 
     # Validate required columns
     validate_required_columns(df)
@@ -14,7 +14,7 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 import pandas as pd
 
@@ -445,18 +445,22 @@ def load_vehicles_data() -> None:
         conn.close()
 
 
-def load_kaggle_data() -> None:
+def load_kaggle_data(reader: Callable[[Path], pd.DataFrame] = pd.read_csv) -> None:
     """
     Load Kaggle cleaned CSV data into raw.kaggle_films table.
 
     Reads kaggle_cleaned.csv and inserts all film records with metadata.
 
+    Args:
+        reader: Callable that reads the cleaned CSV path into a DataFrame
+            (defaults to pd.read_csv; tests can inject an in-memory frame)
+
     Raises:
         Exception: If data loading fails
     """
     logger.info("→ Loading Kaggle CSV data...")
 
-    df = pd.read_csv(KAGGLE_CLEANED_CSV)
+    df = reader(KAGGLE_CLEANED_CSV)
     logger.info(f"Loaded {len(df)} records from Kaggle CSV")
 
     conn = get_duckdb_connection()
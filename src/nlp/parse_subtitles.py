@@ -6,18 +6,29 @@ dialogue data for text analysis.
 """
 # Standard library imports
 import argparse
+import functools
 import json
 import logging
 import os
 import random
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat, starmap
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-# Third-party imports
-import pysrt
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 # Local imports
 from src.shared.config import LOG_LEVEL
@@ -29,29 +40,244 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.debug(
+        "orjson not available - parsed subtitles will be read and written with stdlib json"
+    )
 
-def _open_srt_with_encoding_detection(
-    filepath: str, expected_language: Optional[str] = None
-) -> Tuple[pysrt.SubRipFile, str]:
+# Compiled regex for HTML formatting tags (<i>, <b>, <font ...>, etc.)
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+# Batch variant: texts are joined with DIALOGUE_BATCH_SEPARATOR, so a tag
+# match must not run across it into the next text
+DIALOGUE_BATCH_SEPARATOR = "\x00"
+BATCH_HTML_TAG_PATTERN = re.compile(r"<[^>\x00]+>")
+
+# .srt timing line separator and the HH:MM:SS,mmm field separators
+# (":", "." and "," are all accepted, as in pysrt)
+SRT_TIMESTAMP_SEPARATOR = "-->"
+SRT_TIME_FIELD_PATTERN = re.compile(r"[:.,]")
+LEADING_DIGITS_PATTERN = re.compile(r"\d+")
+
+# Read buffer for streaming .srt files (the io default is 8 KiB)
+SRT_READ_BUFFER_SIZE = 128 * 1024
+
+# Fast path for well-formed timing lines; anything else takes the lenient path.
+# The lookaheads require the end time to be followed by whitespace (position
+# info) or end of line, and forbid a second "-->" later on the line.
+SRT_TIMING_LINE_PATTERN = re.compile(
+    r"\s*(\d+):(\d+):(\d+)[,.](\d+)\s*-->\s*(\d+):(\d+):(\d+)[,.](\d+)(?=\s|$)(?!.*-->)"
+)
+
+# Result type of an .srt line parser run by _read_srt_with_encoding_detection
+SrtParseResult = TypeVar("SrtParseResult")
+
+# Column layout for Parquet output (DuckDB SQL types). Times stay DOUBLE so
+# they round-trip exactly like the JSON output. subtitle_index is a nullable
+# INTEGER: missing and non-numeric index lines are both stored as NULL.
+PARQUET_SUBTITLE_COLUMNS = {
+    "subtitle_index": "INTEGER",
+    "start_time": "DOUBLE",
+    "end_time": "DOUBLE",
+    "duration": "DOUBLE",
+    "dialogue_text": "VARCHAR",
+}
+
+# COPY ... (KV_METADATA ...) needs DuckDB 1.1; the project itself supports 0.10
+PARQUET_MIN_DUCKDB_VERSION = (1, 1)
+
+
+def _parse_srt_int(digits: str) -> int:
+    """Parse a timestamp field, keeping only leading digits (0 if none)."""
+    try:
+        return int(digits)
+    except ValueError:
+        match = LEADING_DIGITS_PATTERN.match(digits)
+        return int(match.group()) if match else 0
+
+
+def _parse_srt_time(value: str) -> float:
+    """
+    Convert an .srt timestamp (HH:MM:SS,mmm) to seconds.
+
+    Raises:
+        ValueError: If the timestamp does not have exactly four fields
+    """
+    fields = SRT_TIME_FIELD_PATTERN.split(value)
+    if len(fields) != 4:
+        raise ValueError(f"Invalid timestamp: {value!r}")
+    return _srt_seconds(*map(_parse_srt_int, fields))
+
+
+def _srt_seconds(hours: int, minutes: int, seconds: int, milliseconds: int) -> float:
+    """Combine timestamp fields into seconds via integer milliseconds."""
+    return (((hours * 60 + minutes) * 60 + seconds) * 1000 + milliseconds) / 1000.0
+
+
+def _iter_srt_blocks(lines: Iterable[str]) -> Iterator[List[str]]:
+    """Yield the non-blank lines of each blank-line separated .srt block."""
+    block: List[str] = []
+    for line in lines:
+        if line.strip():
+            block.append(line.rstrip())
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def _srt_timing_line_position(block: List[str]) -> int:
     """
-    Open .srt file with automatic encoding detection.
+    Return the position of the timing line in an .srt block (0 or 1).
+
+    Raises:
+        ValueError: If the block has fewer than two lines
+    """
+    if len(block) < 2:
+        raise ValueError("Block has fewer than two lines")
+    return 0 if SRT_TIMESTAMP_SEPARATOR in block[0] else 1
+
+
+def _parse_srt_block(block: List[str]) -> Dict[str, Any]:
+    """
+    Parse one .srt block into a raw cue dictionary.
+
+    The index line is optional; a block whose first line is the timing line
+    gets subtitle_index None. Non-numeric index lines are kept as-is.
+
+    Raises:
+        ValueError: If the block has no valid timing line
+    """
+    timing_pos = _srt_timing_line_position(block)
+
+    index: Any = None
+    if timing_pos:
+        index = block[0]
+        try:
+            index = int(index)
+        except ValueError:
+            pass
+
+    start_time, end_time = _parse_srt_timing_line(block[timing_pos])
+
+    return {
+        "subtitle_index": index,
+        "start_time": start_time,
+        "end_time": end_time,
+        "text": "\n".join(block[timing_pos + 1 :]),
+    }
+
+
+def _parse_srt_timing_line(line: str) -> Tuple[float, float]:
+    """
+    Parse an .srt timing line into (start_time, end_time) in seconds.
+
+    Raises:
+        ValueError: If the line is not a valid timing line
+    """
+    match = SRT_TIMING_LINE_PATTERN.match(line)
+    if match:
+        fields = tuple(map(int, match.groups()))
+        return _srt_seconds(*fields[:4]), _srt_seconds(*fields[4:])
+
+    timestamps = line.split(SRT_TIMESTAMP_SEPARATOR)
+    if len(timestamps) != 2:
+        raise ValueError(f"Invalid timing line: {line!r}")
+    start, end_and_position = timestamps
+    # Anything after the end time (e.g. "X1:10 X2:20") is position info
+    end_fields = end_and_position.split(maxsplit=1)
+    if not end_fields:
+        raise ValueError(f"Missing end time: {line!r}")
+
+    return _parse_srt_time(start.strip()), _parse_srt_time(end_fields[0])
+
+
+def _parse_srt_lines(lines: Iterable[str]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Parse .srt lines in a single pass.
+
+    Returns:
+        Tuple of (list of raw cue dictionaries, count of malformed blocks skipped)
+    """
+    cues: List[Dict[str, Any]] = []
+    malformed_count = 0
+    for block in _iter_srt_blocks(lines):
+        try:
+            cues.append(_parse_srt_block(block))
+        except ValueError as e:
+            malformed_count += 1
+            logger.warning(f"Skipping malformed subtitle block starting {block[0]!r}: {e}")
+    return cues, malformed_count
+
+
+def _sample_srt_lines(
+    lines: Iterable[str], sample_positions: Collection[int]
+) -> Tuple[Dict[int, Dict[str, Any]], int, int]:
+    """
+    Count the cues in .srt lines, building only those at sample_positions.
+
+    Every block's timing line is still checked, so the count matches what
+    _parse_srt_lines would return.
+
+    Returns:
+        Tuple of (raw cues keyed by list position, total cue count,
+        count of malformed blocks skipped)
+    """
+    sampled: Dict[int, Dict[str, Any]] = {}
+    cue_count = 0
+    malformed_count = 0
+    for block in _iter_srt_blocks(lines):
+        try:
+            if cue_count in sample_positions:
+                sampled[cue_count] = _parse_srt_block(block)
+            else:
+                _parse_srt_timing_line(block[_srt_timing_line_position(block)])
+        except ValueError as e:
+            malformed_count += 1
+            logger.warning(f"Skipping malformed subtitle block starting {block[0]!r}: {e}")
+            continue
+        cue_count += 1
+    return sampled, cue_count, malformed_count
+
+
+def _stream_srt_cues(
+    filepath: str, encoding: str, parse: Callable[[Iterable[str]], SrtParseResult]
+) -> SrtParseResult:
+    """Run an .srt line parser over a file read through a large buffer."""
+    with open(filepath, "r", encoding=encoding, buffering=SRT_READ_BUFFER_SIZE) as f:
+        return parse(f)
+
+
+def _read_srt_with_encoding_detection(
+    filepath: str,
+    expected_language: Optional[str],
+    parse: Callable[[Iterable[str]], SrtParseResult],
+) -> Tuple[SrtParseResult, str]:
+    """
+    Read .srt file with automatic encoding detection and run a line parser on it.
 
     Tries UTF-8 first, falls back to Latin-1 if UTF-8 fails (for English files only).
     For Japanese files, UTF-8 is required (no fallback to Latin-1).
-    Logs the encoding used for audit trail.
+    The file is streamed block by block, so the raw text is never held in
+    memory alongside the parsed cues. Logs the encoding used for audit trail.
 
     Args:
         filepath: Path to .srt subtitle file
         expected_language: Optional language code ('en' or 'ja') for encoding preference
+        parse: Line parser (_parse_srt_lines, or _sample_srt_lines bound to positions)
 
     Returns:
-        Tuple of (SubRipFile object, encoding_used)
+        Tuple of (parser result, encoding_used)
 
     Raises:
         UnicodeDecodeError: If file encoding cannot be detected after fallbacks
     """
     encoding_used = "utf-8"
-    subtitles: Optional[pysrt.SubRipFile] = None
 
     # Detect language from filename if not provided
     if expected_language is None:
@@ -69,35 +295,48 @@ def _open_srt_with_encoding_detection(
             expected_language = "ar"
 
     try:
-        subtitles = pysrt.open(filepath, encoding="utf-8")
+        # utf-8-sig also strips a leading byte order mark if present
+        parsed = _stream_srt_cues(filepath, "utf-8-sig", parse)
     except UnicodeDecodeError:
         # For Japanese files, UTF-8 is required - don't fallback to Latin-1
         if expected_language == "ja":
             logger.error(f"UTF-8 encoding failed for Japanese file {filepath}. Japanese files must be UTF-8 encoded.")
             raise
-        # For all other languages (EN, FR, ES, NL, AR), try Latin-1 fallback
+        # For all other languages (EN, FR, ES, NL, AR), fall back to Latin-1,
+        # which maps every byte and therefore cannot fail
         logger.warning(f"UTF-8 encoding failed for {filepath} (language: {expected_language}), trying Latin-1")
-        try:
-            encoding_used = "latin-1"
-            subtitles = pysrt.open(filepath, encoding="latin-1")
-        except UnicodeDecodeError as e:
-            logger.error(f"Failed to decode {filepath} with UTF-8 and Latin-1: {e}")
-            raise
-
-    if subtitles is None:
-        raise ValueError(f"Failed to open subtitle file: {filepath}")
+        encoding_used = "latin-1"
+        parsed = _stream_srt_cues(filepath, "latin-1", parse)
 
     language_info = f" (language: {expected_language})" if expected_language else ""
     logger.info(f"Parsing {filepath}{language_info} with encoding: {encoding_used}")
-    return subtitles, encoding_used
+    return parsed, encoding_used
+
+
+def _open_srt_with_encoding_detection(
+    filepath: str, expected_language: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], int, str]:
+    """
+    Read and parse .srt file with automatic encoding detection.
+
+    Returns:
+        Tuple of (raw cue dictionaries, malformed block count, encoding_used)
+
+    Raises:
+        UnicodeDecodeError: If file encoding cannot be detected after fallbacks
+    """
+    (cues, malformed_count), encoding_used = _read_srt_with_encoding_detection(
+        filepath, expected_language, _parse_srt_lines
+    )
+    return cues, malformed_count, encoding_used
 
 
 def parse_srt_file(filepath: str, expected_language: Optional[str] = None) -> Tuple[List[Dict[str, Any]], int]:
     """
     Parse .srt subtitle file and extract structured data.
 
-    Uses pysrt library to load subtitle file with encoding detection and
-    handles malformed entries gracefully. Extracts:
+    Runs the file through a lightweight .srt block parser with encoding
+    detection and skips malformed entries gracefully. Extracts:
     - subtitle_index: Sequential subtitle number (1-based)
     - start_time: Start time in seconds (float)
     - end_time: End time in seconds (float)
@@ -119,48 +358,22 @@ def parse_srt_file(filepath: str, expected_language: Optional[str] = None) -> Tu
     """
     logger.info(f"Parsing subtitle file: {filepath}")
 
-    # Open file with encoding detection
-    subtitles, encoding_used = _open_srt_with_encoding_detection(filepath, expected_language)
-
-    result: List[Dict[str, Any]] = []
-    skipped_count = 0
-
-    for subtitle in subtitles:
-        try:
-            # Extract subtitle_index from subtitle.index property
-            subtitle_index = subtitle.index
-
-            # Extract start_time in seconds: convert SubRipTime to total seconds
-            # Using ordinal property which gives milliseconds since start
-            start_time = subtitle.start.ordinal / 1000.0
-
-            # Extract end_time in seconds: convert SubRipTime to total seconds
-            end_time = subtitle.end.ordinal / 1000.0
-
-            # Calculate duration: end_time - start_time (in seconds)
-            duration = end_time - start_time
-
-            # Extract dialogue_text: use subtitle.text property and clean it
-            dialogue_text = clean_dialogue_text(subtitle.text)
-
-            result.append(
-                {
-                    "subtitle_index": subtitle_index,
-                    "start_time": start_time,
-                    "end_time": end_time,
-                    "duration": duration,
-                    "dialogue_text": dialogue_text,
-                }
-            )
+    # Read and parse file with encoding detection
+    cues, skipped_count, encoding_used = _open_srt_with_encoding_detection(
+        filepath, expected_language
+    )
 
-        except (AttributeError, ValueError, TypeError) as e:
-            # Handle malformed timestamps or other parsing errors
-            skipped_count += 1
-            logger.warning(
-                f"Subtitle {subtitle.index if hasattr(subtitle, 'index') else 'unknown'} "
-                f"has malformed timestamp, skipping: {e}"
-            )
-            continue
+    dialogue_texts = clean_dialogue_texts([cue["text"] for cue in cues])
+    result: List[Dict[str, Any]] = [
+        {
+            "subtitle_index": cue["subtitle_index"],
+            "start_time": cue["start_time"],
+            "end_time": cue["end_time"],
+            "duration": cue["end_time"] - cue["start_time"],
+            "dialogue_text": dialogue_text,
+        }
+        for cue, dialogue_text in zip(cues, dialogue_texts)
+    ]
 
     logger.info(
         f"Successfully parsed {len(result)} subtitles from {filepath} "
@@ -169,6 +382,22 @@ def parse_srt_file(filepath: str, expected_language: Optional[str] = None) -> Tu
     return result, skipped_count
 
 
+@functools.lru_cache(maxsize=512)
+def _film_name_from_slug(film_slug: str) -> str:
+    """Convert a film slug (e.g. "spirited_away_ja") to a display name ("Spirited Away")."""
+    # Extract film_name from slug: convert underscores to spaces, capitalize words
+    # Remove language suffix (_en, _ja, _fr, _es, _nl, _ar) before processing
+    name_part = (
+        film_slug.replace("_en", "")
+        .replace("_ja", "")
+        .replace("_fr", "")
+        .replace("_es", "")
+        .replace("_nl", "")
+        .replace("_ar", "")
+    )
+    return " ".join(word.capitalize() for word in name_part.split("_"))
+
+
 def extract_film_metadata(
     filepath: str, subtitles: List[Dict[str, Any]], language_code: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -212,10 +441,7 @@ def extract_film_metadata(
         else:
             language_code = "en"  # Default to 'en' if no language suffix detected
 
-    # Extract film_name from slug: convert underscores to spaces, capitalize words
-    # Remove language suffix (_en, _ja, _fr, _es, _nl, _ar) before processing
-    name_part = film_slug.replace("_en", "").replace("_ja", "").replace("_fr", "").replace("_es", "").replace("_nl", "").replace("_ar", "")
-    film_name = " ".join(word.capitalize() for word in name_part.split("_"))
+    film_name = _film_name_from_slug(film_slug)
 
     # Calculate total_subtitles: count of parsed subtitle entries
     total_subtitles = len(subtitles)
@@ -264,7 +490,8 @@ def clean_dialogue_text(text: str) -> str:
         return ""
 
     # Remove HTML tags using regex: removes <i>, <b>, <u>, etc.
-    cleaned = re.sub(r"<[^>]+>", "", text)
+    # Most cues carry no markup, so skip the regex scan when there is no "<"
+    cleaned = HTML_TAG_PATTERN.sub("", text) if "<" in text else text
 
     # Normalize whitespace: join multiple lines/spaces with single space
     # This handles multi-line dialogue and extra whitespace
@@ -273,6 +500,33 @@ def clean_dialogue_text(text: str) -> str:
     return cleaned
 
 
+def clean_dialogue_texts(texts: List[str]) -> List[str]:
+    """
+    Clean a batch of dialogue texts; same result as clean_dialogue_text on each.
+
+    The texts are joined so HTML tags are stripped with one regex pass over the
+    whole batch instead of one call per subtitle. Falls back to per-text
+    cleaning if any text already contains the batch separator.
+
+    Args:
+        texts: Raw dialogue texts, in subtitle order
+
+    Returns:
+        Cleaned dialogue texts, in the same order
+    """
+    if not texts:
+        return []
+
+    joined = DIALOGUE_BATCH_SEPARATOR.join(texts)
+    if joined.count(DIALOGUE_BATCH_SEPARATOR) != len(texts) - 1:
+        return [clean_dialogue_text(text) for text in texts]
+
+    if "<" in joined:
+        joined = BATCH_HTML_TAG_PATTERN.sub("", joined)
+
+    return [" ".join(text.split()) for text in joined.split(DIALOGUE_BATCH_SEPARATOR)]
+
+
 def save_parsed_subtitles(
     subtitles: List[Dict[str, Any]], metadata: Dict[str, Any], output_path: str
 ) -> None:
@@ -280,7 +534,8 @@ def save_parsed_subtitles(
     Save parsed subtitle data as JSON file.
 
     Creates output directory if needed and saves structured JSON with
-    metadata and subtitle entries.
+    metadata and subtitle entries. Paths ending in ``.parquet`` are written
+    as a columnar Parquet file instead (see save_parsed_subtitles_parquet).
 
     Args:
         subtitles: List of parsed subtitle dictionaries
@@ -290,6 +545,10 @@ def save_parsed_subtitles(
     Raises:
         OSError: If output directory cannot be created or file cannot be written
     """
+    if str(output_path).endswith(".parquet"):
+        save_parsed_subtitles_parquet(subtitles, metadata, output_path)
+        return
+
     # Create output directory if needed
     output_dir = Path(output_path).parent
     os.makedirs(output_dir, exist_ok=True)
@@ -300,15 +559,160 @@ def save_parsed_subtitles(
         "subtitles": subtitles,
     }
 
-    # Save JSON file with indentation for readability
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Save JSON file with indentation for readability, serialised in one call.
+    # orjson emits UTF-8 (like ensure_ascii=False) with the same 2-space layout
+    if ORJSON_AVAILABLE:
+        Path(output_path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        Path(output_path).write_text(
+            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+
+    logger.info(f"Saved parsed subtitles to {output_path}")
+
+
+def _sql_string_literal(value: str) -> str:
+    """Quote a value as a SQL string literal (COPY targets and options cannot be bound)."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def save_parsed_subtitles_parquet(
+    subtitles: List[Dict[str, Any]], metadata: Dict[str, Any], output_path: str
+) -> None:
+    """
+    Save parsed subtitle data as a zstd-compressed Parquet file.
+
+    One typed column per subtitle field instead of one JSON object per entry;
+    the film metadata is stored as JSON in the file's key/value metadata.
+    Written through DuckDB, which reads it back with
+    ``SELECT * FROM 'file.parquet'`` and ``parquet_kv_metadata()``.
+
+    Args:
+        subtitles: List of parsed subtitle dictionaries
+        metadata: Film metadata dictionary
+        output_path: Path where the Parquet file should be saved
+
+    Raises:
+        RuntimeError: If the installed DuckDB is older than 1.1
+        OSError: If output directory cannot be created
+        duckdb.Error: If the file cannot be written
+    """
+    import duckdb
+    import pandas as pd
+
+    duckdb_version = tuple(int(part) for part in duckdb.__version__.split(".")[:2])
+    if duckdb_version < PARQUET_MIN_DUCKDB_VERSION:
+        raise RuntimeError(
+            f"Parquet subtitle output needs duckdb>=1.1 (installed: {duckdb.__version__}); "
+            "upgrade duckdb or save as .json"
+        )
+
+    output_dir = Path(output_path).parent
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Build each column once; the casts pin the schema even for empty input.
+    # Indexes go in as text so a non-numeric one cannot mix types in the
+    # column, and TRY_CAST turns it into NULL instead of failing the write.
+    columns = {
+        column: [entry[column] for entry in subtitles] for column in PARQUET_SUBTITLE_COLUMNS
+    }
+    columns["subtitle_index"] = [
+        None if index is None else str(index) for index in columns["subtitle_index"]
+    ]
+    frame = pd.DataFrame(columns)
+    # Only the fixed column names and types above are spliced in here; every
+    # caller-supplied value goes through _sql_string_literal
+    select_list = ", ".join(
+        f"TRY_CAST({column} AS {sql_type}) AS {column}"
+        for column, sql_type in PARQUET_SUBTITLE_COLUMNS.items()
+    )
+    target = _sql_string_literal(str(output_path))
+    metadata_literal = _sql_string_literal(json.dumps(metadata, ensure_ascii=False))
+
+    conn = duckdb.connect(":memory:")
+    try:
+        conn.register("subtitles_frame", frame)
+        conn.execute(
+            f"COPY (SELECT {select_list} FROM subtitles_frame) TO {target} "
+            f"(FORMAT PARQUET, COMPRESSION ZSTD, KV_METADATA {{metadata: {metadata_literal}}})"
+        )
+    finally:
+        conn.close()
 
     logger.info(f"Saved parsed subtitles to {output_path}")
 
 
+def _process_subtitle_file(filepath: Path, output_dir: Path, progress: str) -> Dict[str, Any]:
+    """
+    Parse one .srt file and save its JSON output.
+
+    Module-level (picklable) so process_all_subtitles can run it in worker
+    processes. Errors are caught and reported in the result, never raised.
+
+    Args:
+        filepath: Path to .srt subtitle file
+        output_dir: Directory for the parsed JSON file
+        progress: "count/total" label for logging
+
+    Returns:
+        Processing result dictionary (see process_all_subtitles)
+    """
+    film_slug = Path(filepath).stem
+    
+    # Detect file language from filename (support both standard and v2 patterns)
+    if filepath.name.endswith("_ja.srt") or filepath.name.endswith("_ja_v2.srt"):
+        file_language = "ja"
+    elif filepath.name.endswith("_fr.srt") or filepath.name.endswith("_fr_v2.srt"):
+        file_language = "fr"
+    elif filepath.name.endswith("_es.srt") or filepath.name.endswith("_es_v2.srt"):
+        file_language = "es"
+    elif filepath.name.endswith("_nl.srt") or filepath.name.endswith("_nl_v2.srt"):
+        file_language = "nl"
+    elif filepath.name.endswith("_ar.srt") or filepath.name.endswith("_ar_v2.srt"):
+        file_language = "ar"
+    else:
+        file_language = "en"
+    
+    logger.info(f"Processing {progress}: {film_slug} ({file_language})")
+
+    try:
+        # Parse subtitle file with language detection
+        subtitles, skipped_count = parse_srt_file(str(filepath), expected_language=file_language)
+
+        # Extract metadata with language code
+        metadata = extract_film_metadata(str(filepath), subtitles, language_code=file_language)
+
+        # Build output path using custom output_dir or default
+        output_path = str(output_dir / f"{film_slug}_parsed.json")
+
+        # Save parsed JSON
+        save_parsed_subtitles(subtitles, metadata, output_path)
+
+        return {
+            "film_slug": film_slug,
+            "success": True,
+            "error_message": None,
+            "output_path": output_path,
+            "skipped_count": skipped_count,
+        }
+
+    except Exception as e:
+        error_msg = str(e)
+        logger.error(f"Failed to process {film_slug}: {error_msg}")
+        return {
+            "film_slug": film_slug,
+            "success": False,
+            "error_message": error_msg,
+            "output_path": None,
+        }
+
+
 def process_all_subtitles(
-    subtitle_dir: Path, film_filter: Optional[List[str]] = None, language: str = "en", output_dir: Optional[Path] = None
+    subtitle_dir: Path,
+    film_filter: Optional[List[str]] = None,
+    language: str = "en",
+    output_dir: Optional[Path] = None,
+    max_workers: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Process all .srt subtitle files in directory.
@@ -321,6 +725,7 @@ def process_all_subtitles(
         film_filter: Optional list of film slugs to process (if None, process all)
         language: Language to process: 'en' (English), 'ja' (Japanese), or 'all' (both)
         output_dir: Optional output directory path (default: data/processed/subtitles)
+        max_workers: Optional worker process count (default: CPU count; 1 = serial)
 
     Returns:
         List of processing results:
@@ -381,60 +786,22 @@ def process_all_subtitles(
     total_files = len(filtered_files)
     logger.info(f"Found {total_files} {language} subtitle files to process")
 
-    # Determine language for each file (needed for processing)
-    # If language == 'all', we need to detect from filename
-    for count, filepath in enumerate(filtered_files, 1):
-        film_slug = Path(filepath).stem
-        
-        # Detect file language from filename (support both standard and v2 patterns)
-        if filepath.name.endswith("_ja.srt") or filepath.name.endswith("_ja_v2.srt"):
-            file_language = "ja"
-        elif filepath.name.endswith("_fr.srt") or filepath.name.endswith("_fr_v2.srt"):
-            file_language = "fr"
-        elif filepath.name.endswith("_es.srt") or filepath.name.endswith("_es_v2.srt"):
-            file_language = "es"
-        elif filepath.name.endswith("_nl.srt") or filepath.name.endswith("_nl_v2.srt"):
-            file_language = "nl"
-        elif filepath.name.endswith("_ar.srt") or filepath.name.endswith("_ar_v2.srt"):
-            file_language = "ar"
-        else:
-            file_language = "en"
-        
-        logger.info(f"Processing {count}/{total_files}: {film_slug} ({file_language})")
-
-        try:
-            # Parse subtitle file with language detection
-            subtitles, skipped_count = parse_srt_file(str(filepath), expected_language=file_language)
-
-            # Extract metadata with language code
-            metadata = extract_film_metadata(str(filepath), subtitles, language_code=file_language)
-
-            # Build output path using custom output_dir or default
-            output_path = str(output_dir / f"{film_slug}_parsed.json")
-
-            # Save parsed JSON
-            save_parsed_subtitles(subtitles, metadata, output_path)
-
-            results.append(
-                {
-                    "film_slug": film_slug,
-                    "success": True,
-                    "error_message": None,
-                    "output_path": output_path,
-                    "skipped_count": skipped_count,
-                }
-            )
+    progress = [f"{count}/{total_files}" for count in range(1, total_files + 1)]
 
-        except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Failed to process {film_slug}: {error_msg}")
-            results.append(
-                {
-                    "film_slug": film_slug,
-                    "success": False,
-                    "error_message": error_msg,
-                    "output_path": None,
-                }
+    # Files are independent, so parse them in parallel when there is more than one.
+    # Results come back in discovery order either way.
+    if total_files <= 1 or max_workers == 1:
+        results.extend(map(_process_subtitle_file, filtered_files, repeat(output_dir), progress))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results.extend(
+                executor.map(
+                    _process_subtitle_file,
+                    filtered_files,
+                    repeat(output_dir),
+                    progress,
+                    chunksize=4,
+                )
             )
 
     return results
@@ -464,21 +831,31 @@ def validate_parsed_subtitles(
         }
     """
     # Load JSON to detect language from metadata
-    with open(json_filepath, "r", encoding="utf-8") as f:
-        json_data = json.load(f)
+    if ORJSON_AVAILABLE:
+        json_data = orjson.loads(Path(json_filepath).read_bytes())
+    else:
+        with open(json_filepath, "r", encoding="utf-8") as f:
+            json_data = json.load(f)
     
     language = json_data.get("metadata", {}).get("language_code", "en")
     
     logger.info(f"Validating {language} subtitles: {srt_filepath} vs {json_filepath}")
 
-    # Count subtitle entries in original .srt file (with language-aware encoding detection)
-    srt_subtitles, _ = _open_srt_with_encoding_detection(srt_filepath, expected_language=language)
-
-    srt_count = len(srt_subtitles)
-
     # Count subtitle entries in parsed JSON file (already loaded above)
     json_count = json_data["metadata"]["total_subtitles"]
 
+    # Select 5 random indices to spot-check (or all if less than 5)
+    num_checks = min(5, json_count)
+    random_indices = random.sample(range(json_count), num_checks) if json_count > 0 else []
+
+    # Count subtitle entries in original .srt file (with language-aware encoding detection).
+    # Only the spot-checked cues are built; the rest are just counted
+    (srt_samples, srt_count, _), _ = _read_srt_with_encoding_detection(
+        srt_filepath,
+        language,
+        functools.partial(_sample_srt_lines, sample_positions=frozenset(random_indices)),
+    )
+
     # Compare counts: should match
     counts_match = srt_count == json_count
 
@@ -487,10 +864,6 @@ def validate_parsed_subtitles(
     # Spot-check 5 random subtitle entries
     spot_check_results: List[Dict[str, Any]] = []
     if json_count > 0:
-        # Select 5 random indices (or all if less than 5)
-        num_checks = min(5, json_count)
-        random_indices = random.sample(range(json_count), num_checks)
-
         validated_count = 0
 
         for list_idx in random_indices:
@@ -498,16 +871,16 @@ def validate_parsed_subtitles(
             parsed_subtitle = json_data["subtitles"][list_idx]
             parsed_index = parsed_subtitle["subtitle_index"]
 
-            # Find corresponding subtitle in .srt file (pysrt uses 1-based index)
-            # pysrt subtitles are accessed by list index (0-based), not subtitle.index
-            if list_idx < len(srt_subtitles):
-                srt_subtitle = srt_subtitles[list_idx]
-                original_text = srt_subtitle.text
-                original_start = srt_subtitle.start.ordinal / 1000.0
+            # Find corresponding cue in .srt file by list position (0-based),
+            # not by its subtitle_index (1-based, and not guaranteed sequential)
+            if list_idx in srt_samples:
+                srt_subtitle = srt_samples[list_idx]
+                original_text = srt_subtitle["text"]
+                original_start = srt_subtitle["start_time"]
 
                 # Verify: subtitle_index matches, start_time matches (within 0.1s tolerance),
                 # dialogue_text matches (after cleaning)
-                index_match = srt_subtitle.index == parsed_subtitle["subtitle_index"]
+                index_match = srt_subtitle["subtitle_index"] == parsed_subtitle["subtitle_index"]
                 time_match = abs(original_start - parsed_subtitle["start_time"]) < 0.1
                 text_match = clean_dialogue_text(original_text) == parsed_subtitle["dialogue_text"]
 
@@ -553,6 +926,54 @@ def validate_parsed_subtitles(
     }
 
 
+def _validate_subtitle_pair(srt_filepath: str, json_filepath: str) -> Dict[str, Any]:
+    """
+    Validate one (.srt, JSON) pair with validate_parsed_subtitles.
+
+    Module-level (picklable) so validate_parsed_subtitles_batch can run it
+    in worker processes. Errors are caught and reported in the result under
+    "error", never raised.
+    """
+    try:
+        return validate_parsed_subtitles(srt_filepath, json_filepath)
+    except Exception as e:
+        logger.error(f"Validation failed for {srt_filepath}: {e}")
+        return {
+            "matched": False,
+            "srt_count": None,
+            "json_count": None,
+            "spot_check_results": [],
+            "error": str(e),
+        }
+
+
+def validate_parsed_subtitles_batch(
+    pairs: List[Tuple[str, str]], max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Validate several (.srt, JSON) pairs in parallel.
+
+    Re-parsing each .srt file is CPU-bound, so pairs are spread over worker
+    processes, as in process_all_subtitles.
+
+    Args:
+        pairs: List of (srt_filepath, json_filepath) tuples
+        max_workers: Optional worker process count (default: CPU count; 1 = serial)
+
+    Returns:
+        Validation reports in the same order as pairs. A pair that cannot be
+        validated gets a report with matched False and an "error" message.
+    """
+    if len(pairs) <= 1 or max_workers == 1:
+        return list(starmap(_validate_subtitle_pair, pairs))
+
+    srt_filepaths, json_filepaths = zip(*pairs)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(_validate_subtitle_pair, srt_filepaths, json_filepaths, chunksize=4)
+        )
+
+
 def main() -> None:
     """
     Main entry point for subtitle parsing script.
@@ -628,7 +1049,8 @@ def main() -> None:
         # Run validation if requested
         if args.validate:
             logger.info("Running validation checks...")
-            validation_results = []
+            validation_pairs = []
+            validated_slugs = []
 
             for result in successful:
                 if result["output_path"]:
@@ -637,23 +1059,25 @@ def main() -> None:
                     srt_filepath = subtitle_dir / f"{film_slug}.srt"
 
                     if srt_filepath.exists():
-                        try:
-                            validation = validate_parsed_subtitles(
-                                str(srt_filepath), result["output_path"]
-                            )
-                            validation_results.append(
-                                {
-                                    "film_slug": film_slug,
-                                    "matched": validation["matched"],
-                                    "srt_count": validation["srt_count"],
-                                    "json_count": validation["json_count"],
-                                }
-                            )
-                        except Exception as e:
-                            logger.error(f"Validation failed for {film_slug}: {e}")
+                        validation_pairs.append((str(srt_filepath), result["output_path"]))
+                        validated_slugs.append(film_slug)
                     else:
                         logger.warning(f"SRT file not found for validation: {srt_filepath}")
 
+            # Failed validations are logged by the worker and left out of the summary
+            validation_results = [
+                {
+                    "film_slug": film_slug,
+                    "matched": validation["matched"],
+                    "srt_count": validation["srt_count"],
+                    "json_count": validation["json_count"],
+                }
+                for film_slug, validation in zip(
+                    validated_slugs, validate_parsed_subtitles_batch(validation_pairs)
+                )
+                if "error" not in validation
+            ]
+
             # Print validation summary
             if validation_results:
                 all_matched = all(r["matched"] for r in validation_results)
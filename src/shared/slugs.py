@@ -0,0 +1,10 @@
+"""Film title to file slug conversion shared by fetching and querying code."""
+
+# Film title -> slug: spaces become underscores, straight and curly
+# apostrophes are dropped ("Howl’s Moving Castle" -> "howls_moving_castle")
+SLUG_TRANSLATION_TABLE = str.maketrans({" ": "_", "'": None, "’": None})
+
+
+def title_to_slug(film_title: str) -> str:
+    """Convert a display film title to its file slug."""
+    return film_title.lower().translate(SLUG_TRANSLATION_TABLE)
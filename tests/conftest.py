@@ -1,6 +1,15 @@
 """Shared pytest fixtures for all tests."""
+import sys
+from pathlib import Path
+
 import pytest
 
+# Make the project root importable once per process so test modules can use
+# ``src.`` and ``scripts.`` imports without mutating sys.path themselves.
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
 
 @pytest.fixture
 def sample_film_data():
@@ -116,6 +116,20 @@ def test_estimate_embedding_cost() -> None:
     assert cost_info["under_budget"] is True
 
 
+def test_estimate_embedding_cost_uses_recorded_token_counts() -> None:
+    """Test that token counts recorded during corpus validation are reused."""
+    documents = [
+        {"text": "This is a test document.", "metadata": {}, "_token_count": 6},
+        {"text": "Another one.", "metadata": {}, "_token_count": 3},
+    ]
+
+    with patch("src.ai.generate_embeddings.estimate_tokens") as mock_estimate:
+        cost_info = estimate_embedding_cost(documents)
+
+    mock_estimate.assert_not_called()
+    assert cost_info["total_tokens"] == 9
+
+
 def test_create_batches() -> None:
     """Test batch splitting logic."""
     documents = [{"doc_id": f"doc_{i}", "text": f"Document {i}"} for i in range(250)]
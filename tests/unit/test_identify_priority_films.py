@@ -9,11 +9,6 @@ from pathlib import Path
 
 import pytest
 
-# Import functions from the script
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from scripts.identify_priority_films import (
     CROSS_LANG_INCONSISTENCY_THRESHOLD,
     FEATURED_FILMS,
@@ -320,6 +315,25 @@ class TestAnalyzeValidationResults:
         assert summaries[0].film_slug == "high_priority"
         assert summaries[1].film_slug == "low_priority"
 
+    def test_top_k_matches_sorted_prefix(self) -> None:
+        """Test that top_k returns the same leading films as a full sort."""
+        results = {
+            f"film_{i}": {
+                "per_language": {
+                    "en": {"status": "PASS" if i % 2 else "FAIL"},
+                    "fr": {"status": "PASS" if i % 3 else "FAIL"},
+                },
+                "cross_language": {"status": "PASS", "max_drift_percent": float(i)},
+            }
+            for i in range(12)
+        }
+
+        full = analyze_validation_results(results)
+        top = analyze_validation_results(results, top_k=3)
+
+        assert len(top) == 3
+        assert [s.film_slug for s in top] == [s.film_slug for s in full[:3]]
+
     def test_empty_results(self) -> None:
         """Test analyzing empty results."""
         results = {}
@@ -7,12 +7,11 @@ and cross-reference matching logic.
 
 import json
 import os
-import tempfile
-from pathlib import Path
 
 import pandas as pd
 import pytest
 
+import src.ingestion.load_kaggle_data as module
 from src.ingestion.load_kaggle_data import (
     clean_currency,
     convert_data_types,
@@ -27,13 +26,61 @@ from src.ingestion.load_kaggle_data import (
 from src.shared.exceptions import DataValidationError
 
 
+KAGGLE_SAMPLE_CSV = "tests/fixtures/kaggle_sample.csv"
+KAGGLE_MISSING_VALUES_CSV = "tests/fixtures/kaggle_missing_values.csv"
+
+
+@pytest.fixture(autouse=True)
+def clear_api_titles_cache():
+    """Drop cached API titles so tests that swap API_FILMS_PATH stay isolated."""
+    yield
+    module._load_api_titles.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def kaggle_sample_df():
+    """Kaggle sample fixture parsed once per session (copy before mutating)."""
+    return load_kaggle_csv(KAGGLE_SAMPLE_CSV)
+
+
+@pytest.fixture(scope="session")
+def kaggle_missing_values_df():
+    """Kaggle fixture with gaps, parsed once per session (copy before mutating)."""
+    return load_kaggle_csv(KAGGLE_MISSING_VALUES_CSV)
+
+
+@pytest.fixture(scope="session")
+def empty_csv_path(tmp_path_factory):
+    """Empty CSV file, created once per test session."""
+    path = tmp_path_factory.mktemp("kaggle_csv") / "empty.csv"
+    path.touch()
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def perfect_match_api_json(tmp_path_factory):
+    """API films cache whose titles exactly match the synthetic Kaggle data."""
+    api_films = [
+        {"title": "Spirited Away"},
+        {"title": "Princess Mononoke"},
+    ]
+    path = tmp_path_factory.mktemp("ghibli_api_cache") / "films.json"
+    path.write_text(json.dumps(api_films), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def save_output_dir(tmp_path_factory):
+    """Shared output directory for save_cleaned_data artifacts."""
+    return tmp_path_factory.mktemp("kaggle_output")
+
+
 class TestLoadKaggleCSV:
     """Tests for load_kaggle_csv function."""
 
-    def test_load_valid_csv(self):
+    def test_load_valid_csv(self, kaggle_sample_df):
         """Test loading a valid CSV file."""
-        csv_path = "tests/fixtures/kaggle_sample.csv"
-        df = load_kaggle_csv(csv_path)
+        df = kaggle_sample_df
 
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 3
@@ -41,10 +88,9 @@ class TestLoadKaggleCSV:
         assert "Year" in df.columns
         assert "Director" in df.columns
 
-    def test_load_csv_with_utf8_encoding(self):
+    def test_load_csv_with_utf8_encoding(self, kaggle_sample_df):
         """Test CSV loads with UTF-8 encoding (default)."""
-        csv_path = "tests/fixtures/kaggle_sample.csv"
-        df = load_kaggle_csv(csv_path)
+        df = kaggle_sample_df
 
         # Should successfully load
         assert len(df) > 0
@@ -57,17 +103,24 @@ class TestLoadKaggleCSV:
 
         assert "not found" in str(exc_info.value).lower()
 
-    def test_load_empty_csv(self):
-        """Test pd.errors.EmptyDataError when CSV is empty."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            temp_path = f.name
-            # Write nothing (empty file)
+    def test_load_with_schema_converts_numeric_columns(self):
+        """Test schema=True converts Year/Budget/Revenue during parsing."""
+        df = load_kaggle_csv(KAGGLE_MISSING_VALUES_CSV, schema=True)
 
-        try:
-            with pytest.raises(pd.errors.EmptyDataError):
-                load_kaggle_csv(temp_path)
-        finally:
-            os.unlink(temp_path)
+        assert df["Year"].dtype == "int64"
+        assert df["Budget"].dtype == "float64"
+        assert df["Revenue"].dtype == "float64"
+        assert df["Year"].tolist() == [2000, 2010, 0]
+        assert df["Budget"].tolist() == [0.0, 5000000.0, 0.0]
+
+        # Already-typed columns pass through convert_data_types unchanged
+        converted = convert_data_types(df.copy())
+        pd.testing.assert_frame_equal(converted, df)
+
+    def test_load_empty_csv(self, empty_csv_path):
+        """Test pd.errors.EmptyDataError when CSV is empty."""
+        with pytest.raises(pd.errors.EmptyDataError):
+            load_kaggle_csv(empty_csv_path)
 
 
 class TestValidateRequiredColumns:
@@ -148,10 +201,9 @@ class TestHandleMissingValues:
         assert cleaned["Screenplay"].iloc[0] == "Unknown"
         assert cleaned["Genre 1"].iloc[0] == "Unknown"
 
-    def test_mixed_missing_values(self):
+    def test_mixed_missing_values(self, kaggle_missing_values_df):
         """Test handling DataFrame with mixed missing values."""
-        csv_path = "tests/fixtures/kaggle_missing_values.csv"
-        df = load_kaggle_csv(csv_path)
+        df = kaggle_missing_values_df.copy(deep=True)
 
         cleaned = handle_missing_values(df)
 
@@ -166,164 +218,135 @@ class TestHandleMissingValues:
 class TestConvertDataTypes:
     """Tests for convert_data_types function."""
 
-    def test_convert_year_to_int(self):
-        """Test Year column converted to integer."""
-        df = pd.DataFrame({
-            "Year": ["2001", "1988.0", 1997]
-        })
+    @pytest.mark.parametrize(
+        "values, expected",
+        [
+            pytest.param(["2001", "1988.0", 1997], [2001, 1988, 1997], id="valid_years"),
+            # Should default to 0 for invalid values
+            pytest.param(["invalid", "", None], [0, 0, 0], id="invalid_years"),
+        ],
+    )
+    def test_convert_year_to_int(self, values, expected):
+        """Test Year column converted to integer, invalid values handled gracefully."""
+        df = pd.DataFrame({"Year": values})
 
         converted = convert_data_types(df)
 
         assert converted["Year"].dtype == "int64"
-        assert converted["Year"].iloc[0] == 2001
-        assert converted["Year"].iloc[1] == 1988
-
-    def test_convert_budget_to_float(self):
-        """Test Budget converted to float with currency cleaning."""
-        df = pd.DataFrame({
-            "Budget": ["$10000000", "$1,000,000", "5000000.00"]
-        })
-
-        converted = convert_data_types(df)
-
-        assert converted["Budget"].dtype == "float64"
-        assert converted["Budget"].iloc[0] == 10000000.0
-        assert converted["Budget"].iloc[1] == 1000000.0
-
-    def test_convert_revenue_to_float(self):
-        """Test Revenue converted to float."""
-        df = pd.DataFrame({
-            "Revenue": ["$289900000", "30476000", "$235,200,000"]
-        })
-
-        converted = convert_data_types(df)
-
-        assert converted["Revenue"].dtype == "float64"
-        assert converted["Revenue"].iloc[0] == 289900000.0
-        assert converted["Revenue"].iloc[2] == 235200000.0
-
-    def test_handle_invalid_year_gracefully(self):
-        """Test invalid year strings handled without crashing."""
-        df = pd.DataFrame({
-            "Year": ["invalid", "", None]
-        })
+        assert converted["Year"].tolist() == expected
+
+    @pytest.mark.parametrize(
+        "column, values, expected",
+        [
+            pytest.param(
+                "Budget",
+                ["$10000000", "$1,000,000", "5000000.00"],
+                [10000000.0, 1000000.0, 5000000.0],
+                id="budget",
+            ),
+            pytest.param(
+                "Revenue",
+                ["$289900000", "30476000", "$235,200,000"],
+                [289900000.0, 30476000.0, 235200000.0],
+                id="revenue",
+            ),
+            pytest.param(
+                "Budget",
+                ["Unknown", None, "not a number"],
+                [0.0, 0.0, 0.0],
+                id="missing_and_invalid",
+            ),
+        ],
+    )
+    def test_convert_currency_to_float(self, column, values, expected):
+        """Test Budget/Revenue converted to float with currency cleaning."""
+        df = pd.DataFrame({column: values})
 
         converted = convert_data_types(df)
 
-        # Should default to 0 for invalid values
-        assert converted["Year"].iloc[0] == 0
-        assert converted["Year"].iloc[1] == 0
-        assert converted["Year"].iloc[2] == 0
+        assert converted[column].dtype == "float64"
+        assert converted[column].tolist() == expected
 
 
 class TestCleanCurrency:
     """Tests for clean_currency utility function."""
 
-    def test_clean_dollar_sign(self):
-        """Test $ symbol removed."""
-        assert clean_currency("$10000000") == 10000000.0
-
-    def test_clean_commas(self):
-        """Test commas removed."""
-        assert clean_currency("1,000,000") == 1000000.0
-
-    def test_clean_both_dollar_and_commas(self):
-        """Test both $ and commas removed."""
-        assert clean_currency("$289,900,000") == 289900000.0
-
-    def test_clean_plain_number(self):
-        """Test plain number string converted."""
-        assert clean_currency("5000000") == 5000000.0
-
-    def test_clean_empty_string(self):
-        """Test empty string returns 0.0."""
-        assert clean_currency("") == 0.0
-
-    def test_clean_none(self):
-        """Test None returns 0.0."""
-        assert clean_currency(None) == 0.0
-
-    def test_clean_invalid_value(self):
-        """Test invalid value returns 0.0 with warning."""
-        assert clean_currency("not a number") == 0.0
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            pytest.param("$10000000", 10000000.0, id="dollar_sign"),
+            pytest.param("1,000,000", 1000000.0, id="commas"),
+            pytest.param("$289,900,000", 289900000.0, id="dollar_sign_and_commas"),
+            pytest.param("5000000", 5000000.0, id="plain_number"),
+            pytest.param("", 0.0, id="empty_string"),
+            pytest.param(None, 0.0, id="none"),
+            pytest.param("not a number", 0.0, id="invalid_value"),
+        ],
+    )
+    def test_clean_currency(self, value, expected):
+        """Test currency strings are cleaned to floats, falling back to 0.0."""
+        assert clean_currency(value) == expected
 
 
 class TestSafeIntConvert:
     """Tests for safe_int_convert utility function."""
 
-    def test_convert_int_string(self):
-        """Test integer string converted."""
-        assert safe_int_convert("2001") == 2001
-
-    def test_convert_float_string(self):
-        """Test float string converted to int."""
-        assert safe_int_convert("1988.0") == 1988
-
-    def test_convert_int(self):
-        """Test int passed through."""
-        assert safe_int_convert(1997) == 1997
-
-    def test_convert_empty_string(self):
-        """Test empty string returns default."""
-        assert safe_int_convert("") == 0
-        assert safe_int_convert("", default=99) == 99
-
-    def test_convert_none(self):
-        """Test None returns default."""
-        assert safe_int_convert(None) == 0
-
-    def test_convert_invalid_string(self):
-        """Test invalid string returns default."""
-        assert safe_int_convert("invalid") == 0
+    @pytest.mark.parametrize(
+        "value, kwargs, expected",
+        [
+            pytest.param("2001", {}, 2001, id="int_string"),
+            pytest.param("1988.0", {}, 1988, id="float_string"),
+            pytest.param(1997, {}, 1997, id="int"),
+            pytest.param("", {}, 0, id="empty_string"),
+            pytest.param("", {"default": 99}, 99, id="empty_string_custom_default"),
+            pytest.param(None, {}, 0, id="none"),
+            pytest.param("invalid", {}, 0, id="invalid_string"),
+        ],
+    )
+    def test_safe_int_convert(self, value, kwargs, expected):
+        """Test values are converted to int, falling back to the default."""
+        assert safe_int_convert(value, **kwargs) == expected
 
 
 class TestNormalizeTitle:
     """Tests for normalize_title function."""
 
-    def test_normalize_lowercase(self):
-        """Test title converted to lowercase."""
-        assert normalize_title("Spirited Away") == "spirited away"
-
-    def test_normalize_remove_newlines(self):
-        """Test newlines removed."""
-        assert normalize_title("Spirited Away\n       (2001)") == "spirited away"
-
-    def test_normalize_remove_year_suffix(self):
-        """Test year in parentheses removed."""
-        assert normalize_title("The Wind Rises (2013)") == "the wind rises"
-
-    def test_normalize_extra_whitespace(self):
-        """Test extra whitespace collapsed."""
-        assert normalize_title("My  Neighbor   Totoro") == "my neighbor totoro"
-
-    def test_normalize_none(self):
-        """Test None returns empty string."""
-        assert normalize_title(None) == ""
-
-    def test_normalize_mixed_formatting(self):
-        """Test complex title normalization."""
-        messy_title = "Princess Mononoke\n       (1997)   "
-        assert normalize_title(messy_title) == "princess mononoke"
-
-    def test_normalize_year_without_parentheses(self):
-        """Test year removal when not in parentheses."""
-        assert normalize_title("Ocean Waves 1994") == "ocean waves"
-
-    def test_normalize_special_characters(self):
-        """Test special character transliteration."""
-        assert normalize_title("Nausicaä of the Valley") == "nausicaa of the valley"
-        assert normalize_title("Château d'été") == "chateau d'ete"
-
-    def test_normalize_real_kaggle_format(self):
-        """Test with actual malformed Kaggle CSV format."""
-        # Real example from Kaggle dataset
-        actual = "The Secret World of Arrietty\n       (2010)"
-        assert normalize_title(actual) == "the secret world of arrietty"
+    @pytest.mark.parametrize(
+        "title, expected",
+        [
+            pytest.param("Spirited Away", "spirited away", id="lowercase"),
+            pytest.param("Spirited Away\n       (2001)", "spirited away", id="newlines"),
+            pytest.param("The Wind Rises (2013)", "the wind rises", id="year_suffix"),
+            pytest.param("My  Neighbor   Totoro", "my neighbor totoro", id="extra_whitespace"),
+            pytest.param(None, "", id="none"),
+            pytest.param(
+                "Princess Mononoke\n       (1997)   ", "princess mononoke", id="mixed_formatting"
+            ),
+            pytest.param("Ocean Waves 1994", "ocean waves", id="year_without_parentheses"),
+            pytest.param(
+                "Nausicaä of the Valley", "nausicaa of the valley", id="special_characters"
+            ),
+            pytest.param("Château d'été", "chateau d'ete", id="special_characters_accents"),
+            pytest.param(
+                "Señorita Straße", "senorita strasse", id="special_characters_multichar"
+            ),
+            # Real example from Kaggle dataset
+            pytest.param(
+                "The Secret World of Arrietty\n       (2010)",
+                "the secret world of arrietty",
+                id="real_kaggle_format",
+            ),
+        ],
+    )
+    def test_normalize_title(self, title, expected):
+        """Test titles are normalized for cross-source comparison."""
+        assert normalize_title(title) == expected
 
 
 class TestCrossReferenceWithGhibliAPI:
     """Tests for cross_reference_with_ghibli_api function."""
 
+    @pytest.mark.integration
     def test_cross_reference_with_real_data(self):
         """Test cross-reference with actual API cache."""
         # Load actual Kaggle data
@@ -350,120 +373,145 @@ class TestCrossReferenceWithGhibliAPI:
         assert report["total_kaggle"] == len(kaggle_df)
         assert report["match_percentage"] <= 100.0
 
-    def test_cross_reference_perfect_match(self):
+    def test_cross_reference_perfect_match(self, perfect_match_api_json, monkeypatch):
         """Test cross-reference with synthetic perfect match."""
-        # Create temp API films file
-        temp_api_dir = tempfile.mkdtemp()
-        temp_api_file = os.path.join(temp_api_dir, "films.json")
+        monkeypatch.setattr(module, "API_FILMS_PATH", perfect_match_api_json)
+
+        # Create matching Kaggle data
+        kaggle_df = pd.DataFrame({
+            "Name": ["Spirited Away (2001)", "Princess Mononoke (1997)"]
+        })
 
+        report = cross_reference_with_ghibli_api(kaggle_df)
+
+        assert report["matched_count"] == 2
+        assert report["match_percentage"] == 100.0
+        assert len(report["kaggle_only"]) == 0
+        assert len(report["api_only"]) == 0
+
+    def test_cross_reference_partial_match(self, tmp_path, monkeypatch):
+        """Test cross-reference with synthetic data covering all match outcomes."""
+        api_file = tmp_path / "films.json"
         api_films = [
             {"title": "Spirited Away"},
-            {"title": "Princess Mononoke"},
+            {"title": "Arrietty"},
+            {"title": "The Red Turtle"},
         ]
+        api_file.write_text(json.dumps(api_films), encoding="utf-8")
+        monkeypatch.setattr(module, "API_FILMS_PATH", str(api_file))
 
-        with open(temp_api_file, "w") as f:
-            json.dump(api_films, f)
-
-        # Create matching Kaggle data
         kaggle_df = pd.DataFrame({
-            "Name": ["Spirited Away (2001)", "Princess Mononoke (1997)"]
+            "Name": [
+                "Spirited Away\n       (2001)",
+                "The Secret World of Arrietty\n       (2010)",
+                "Ocean Waves 1994",
+            ]
         })
 
-        # Temporarily override API_FILMS_PATH
-        import src.ingestion.load_kaggle_data as module
-        original_path = module.API_FILMS_PATH
-        module.API_FILMS_PATH = temp_api_file
-
-        try:
-            report = cross_reference_with_ghibli_api(kaggle_df)
+        report = cross_reference_with_ghibli_api(kaggle_df)
 
-            assert report["matched_count"] == 2
-            assert report["match_percentage"] == 100.0
-            assert len(report["kaggle_only"]) == 0
-            assert len(report["api_only"]) == 0
-        finally:
-            module.API_FILMS_PATH = original_path
-            os.unlink(temp_api_file)
-            os.rmdir(temp_api_dir)
+        assert report["matched_count"] == 2
+        assert report["total_kaggle"] == 3
+        assert report["total_api"] == 3
+        assert report["variations_used"] == 1
+        assert report["kaggle_only"] == ["Ocean Waves 1994"]
+        assert report["api_only"] == ["The Red Turtle"]
 
-    def test_cross_reference_api_file_not_found(self):
+    def test_cross_reference_api_file_not_found(self, monkeypatch):
         """Test error when API films cache doesn't exist."""
-        import src.ingestion.load_kaggle_data as module
-        original_path = module.API_FILMS_PATH
-        module.API_FILMS_PATH = "nonexistent_path.json"
+        monkeypatch.setattr(module, "API_FILMS_PATH", "nonexistent_path.json")
+
+        df = pd.DataFrame({"Name": ["Film A"]})
+        with pytest.raises(FileNotFoundError) as exc_info:
+            cross_reference_with_ghibli_api(df)
+
+        assert "not found" in str(exc_info.value).lower()
+
+    def test_api_titles_loaded_once_per_path(self, perfect_match_api_json, monkeypatch):
+        """Test repeated cross-references reuse the cached API titles."""
+        monkeypatch.setattr(module, "API_FILMS_PATH", perfect_match_api_json)
+        kaggle_df = pd.DataFrame({"Name": ["Spirited Away (2001)"]})
+
+        cross_reference_with_ghibli_api(kaggle_df)
+        cross_reference_with_ghibli_api(kaggle_df)
+
+        cache_info = module._load_api_titles.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+
+    def test_api_titles_reloaded_after_file_change(self, tmp_path, monkeypatch):
+        """Test an edited API cache is re-read instead of served stale."""
+        api_file = tmp_path / "films.json"
+        api_file.write_text(json.dumps([{"title": "Spirited Away"}]), encoding="utf-8")
+        monkeypatch.setattr(module, "API_FILMS_PATH", str(api_file))
+        kaggle_df = pd.DataFrame({"Name": ["Spirited Away (2001)", "Ponyo (2008)"]})
 
-        try:
-            df = pd.DataFrame({"Name": ["Film A"]})
-            with pytest.raises(FileNotFoundError) as exc_info:
-                cross_reference_with_ghibli_api(df)
+        assert cross_reference_with_ghibli_api(kaggle_df)["matched_count"] == 1
 
-            assert "not found" in str(exc_info.value).lower()
-        finally:
-            module.API_FILMS_PATH = original_path
+        api_file.write_text(
+            json.dumps([{"title": "Spirited Away"}, {"title": "Ponyo"}]), encoding="utf-8"
+        )
+        stat = api_file.stat()
+        os.utime(api_file, (stat.st_atime, stat.st_mtime + 10))
+
+        assert cross_reference_with_ghibli_api(kaggle_df)["matched_count"] == 2
 
 
 class TestSaveCleanedData:
     """Tests for save_cleaned_data function."""
 
-    def test_save_csv_and_summary(self):
+    def test_save_csv_and_summary(self, save_output_dir, monkeypatch):
         """Test cleaned CSV and validation summary saved."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test data
-            df = pd.DataFrame({
-                "Name": ["Film A", "Film B"],
-                "Year": [2000, 2010],
-                "Director": ["Director A", "Director B"],
-            })
-
-            cross_ref = {
-                "matched_count": 2,
-                "total_kaggle": 2,
-                "total_api": 2,
-                "match_percentage": 100.0,
-                "kaggle_only": [],
-                "api_only": [],
-            }
-
-            csv_path = os.path.join(temp_dir, "test_output.csv")
-            json_path = os.path.join(temp_dir, "test_summary.json")
-
-            # Override output paths
-            import src.ingestion.load_kaggle_data as module
-            original_summary_path = module.SUMMARY_OUTPUT_PATH
-            module.SUMMARY_OUTPUT_PATH = json_path
-
-            try:
-                save_cleaned_data(df, csv_path, cross_ref)
-
-                # Verify CSV saved
-                assert os.path.exists(csv_path)
-                saved_df = pd.read_csv(csv_path)
-                assert len(saved_df) == 2
-
-                # Verify JSON summary saved
-                assert os.path.exists(json_path)
-                with open(json_path) as f:
-                    summary = json.load(f)
-
-                assert summary["row_count"] == 2
-                assert summary["column_count"] == 3
-                assert "cross_reference" in summary
-                assert summary["cross_reference"]["matched_count"] == 2
-            finally:
-                module.SUMMARY_OUTPUT_PATH = original_summary_path
+        # Create test data
+        df = pd.DataFrame({
+            "Name": ["Film A", "Film B"],
+            "Year": [2000, 2010],
+            "Director": ["Director A", "Director B"],
+        })
+
+        cross_ref = {
+            "matched_count": 2,
+            "total_kaggle": 2,
+            "total_api": 2,
+            "match_percentage": 100.0,
+            "kaggle_only": [],
+            "api_only": [],
+        }
+
+        csv_path = save_output_dir / "test_output.csv"
+        json_path = save_output_dir / "test_summary.json"
+
+        # Override output paths
+        monkeypatch.setattr(module, "SUMMARY_OUTPUT_PATH", str(json_path))
+
+        save_cleaned_data(df, str(csv_path), cross_ref)
+
+        # Verify CSV saved (1 header + 2 rows)
+        assert csv_path.exists()
+        lines = csv_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+        assert lines[0].split(",") == ["Name", "Year", "Director"]
+
+        # Verify JSON summary saved
+        assert json_path.exists()
+        summary = json.loads(json_path.read_text(encoding="utf-8"))
+
+        assert summary["row_count"] == 2
+        assert summary["column_count"] == 3
+        assert "cross_reference" in summary
+        assert summary["cross_reference"]["matched_count"] == 2
 
 
 class TestIntegration:
     """Integration tests for full pipeline."""
 
-    def test_full_pipeline_with_fixture(self):
+    def test_full_pipeline_with_fixture(self, kaggle_sample_df):
         """Test complete pipeline with fixture data."""
         # This would be better as an integration test
         # but including here for completeness
-        csv_path = "tests/fixtures/kaggle_sample.csv"
 
-        # Load
-        df = load_kaggle_csv(csv_path)
+        # Load (cleaning mutates in place, so work on a copy)
+        df = kaggle_sample_df.copy(deep=True)
 
         # Validate
         validate_required_columns(df)
@@ -1,9 +1,8 @@
 """Unit tests for DuckDB data loading module."""
 
 import json
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, mock_open
 
 import pandas as pd
 import pytest
@@ -19,24 +18,74 @@ from src.ingestion.load_to_duckdb import (
     load_vehicles_data,
 )
 
+LOAD_TO_DUCKDB = "src.ingestion.load_to_duckdb"
+
+
+class RecordingConn:
+    """Minimal DuckDB connection stand-in that records execute() calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.close_count = 0
+
+    def execute(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self
+
+    def fetchone(self):
+        return None
+
+    def close(self):
+        self.close_count += 1
+
+    def executed_sql(self):
+        """Return the SQL text of every executed statement, in order."""
+        return [args[0] for args, _ in self.calls]
+
+
+@pytest.fixture(autouse=True)
+def mock_duck(monkeypatch):
+    """Route every get_duckdb_connection() call to a shared Mock connection."""
+    conn = Mock()
+    monkeypatch.setattr(f"{LOAD_TO_DUCKDB}.get_duckdb_connection", lambda: conn)
+    return conn
+
+
+@pytest.fixture
+def recording_conn(monkeypatch):
+    """Route get_duckdb_connection() to a RecordingConn for execute-heavy tests."""
+    conn = RecordingConn()
+    monkeypatch.setattr(f"{LOAD_TO_DUCKDB}.get_duckdb_connection", lambda: conn)
+    return conn
+
+
+@pytest.fixture
+def stub_json_payload(monkeypatch):
+    """Return a setter that makes load_json_file() return the given payload."""
+
+    def install(payload):
+        monkeypatch.setattr(f"{LOAD_TO_DUCKDB}.load_json_file", lambda file_path: payload)
+
+    return install
+
 
 class TestLoadJSONFile:
     """Tests for load_json_file function."""
 
-    def test_load_json_file_success(self, tmp_path):
+    def test_load_json_file_success(self, monkeypatch):
         """Test successful JSON file loading."""
-        # Create test JSON file
         test_data = [
             {"id": "test-1", "title": "Test Film 1"},
             {"id": "test-2", "title": "Test Film 2"},
         ]
 
-        json_file = tmp_path / "test.json"
-        with open(json_file, "w") as f:
-            json.dump(test_data, f)
+        # Serve the JSON from memory instead of writing it to disk
+        monkeypatch.setattr(
+            f"{LOAD_TO_DUCKDB}.open", mock_open(read_data=json.dumps(test_data)), raising=False
+        )
 
         # Load and verify
-        result = load_json_file(json_file)
+        result = load_json_file(Path("/fake/test.json"))
 
         assert len(result) == 2
         assert result[0]["id"] == "test-1"
@@ -51,42 +100,28 @@ class TestLoadJSONFile:
 class TestCreateRawTables:
     """Tests for create_raw_tables function."""
 
-    @patch("src.ingestion.load_to_duckdb.get_duckdb_connection")
-    def test_create_raw_tables_success(self, mock_conn):
+    def test_create_raw_tables_success(self, recording_conn):
         """Test successful table creation."""
-        # Setup mock
-        mock_connection = Mock()
-        mock_conn.return_value = mock_connection
-
         # Execute
         create_raw_tables()
 
+        executed_sql = recording_conn.executed_sql()
+
         # Verify DROP statements executed
-        assert any(
-            "DROP TABLE IF EXISTS raw.films" in str(call)
-            for call in mock_connection.execute.call_args_list
-        )
+        assert any("DROP TABLE IF EXISTS raw.films" in sql for sql in executed_sql)
 
         # Verify CREATE statements executed
-        assert any(
-            "CREATE TABLE IF NOT EXISTS raw.films" in str(call)
-            for call in mock_connection.execute.call_args_list
-        )
+        assert any("CREATE TABLE IF NOT EXISTS raw.films" in sql for sql in executed_sql)
 
         # Verify connection closed
-        mock_connection.close.assert_called_once()
+        assert recording_conn.close_count == 1
 
 
 class TestLoadFilmsData:
     """Tests for load_films_data function."""
 
-    @patch("src.ingestion.load_to_duckdb.get_duckdb_connection")
-    @patch("src.ingestion.load_to_duckdb.load_json_file")
-    def test_load_films_data_success(self, mock_load_json, mock_conn):
+    def test_load_films_data_success(self, recording_conn, stub_json_payload):
         """Test successful films data loading."""
-        # Setup mocks
-        mock_connection = Mock()
-        mock_conn.return_value = mock_connection
 
         test_films = [
             {
@@ -101,30 +136,25 @@ class TestLoadFilmsData:
                 "vehicles": [],
             }
         ]
-        mock_load_json.return_value = test_films
+        stub_json_payload(test_films)
 
         # Execute
         load_films_data()
 
         # Verify
-        assert mock_connection.execute.called
-        assert mock_connection.close.called
+        assert recording_conn.calls
+        assert recording_conn.close_count == 1
 
         # Check that data was inserted
-        insert_call_args = mock_connection.execute.call_args_list[0]
-        assert "INSERT INTO raw.films" in insert_call_args[0][0]
+        assert "INSERT INTO raw.films" in recording_conn.executed_sql()[0]
 
 
 class TestLoadPeopleData:
     """Tests for load_people_data function."""
 
-    @patch("src.ingestion.load_to_duckdb.get_duckdb_connection")
-    @patch("src.ingestion.load_to_duckdb.load_json_file")
-    def test_load_people_data_success(self, mock_load_json, mock_conn):
+    def test_load_people_data_success(self, mock_duck, stub_json_payload):
         """Test successful people data loading."""
-        # Setup mocks
-        mock_connection = Mock()
-        mock_conn.return_value = mock_connection
+        mock_connection = mock_duck
 
         test_people = [
             {
@@ -135,7 +165,7 @@ class TestLoadPeopleData:
                 "films": ["url1"],
             }
         ]
-        mock_load_json.return_value = test_people
+        stub_json_payload(test_people)
 
         # Execute
         load_people_data()
@@ -148,13 +178,9 @@ class TestLoadPeopleData:
 class TestLoadKaggleData:
     """Tests for load_kaggle_data function."""
 
-    @patch("src.ingestion.load_to_duckdb.get_duckdb_connection")
-    @patch("src.ingestion.load_to_duckdb.pd.read_csv")
-    def test_load_kaggle_data_success(self, mock_read_csv, mock_conn):
+    def test_load_kaggle_data_success(self, mock_duck):
         """Test successful Kaggle CSV data loading."""
-        # Setup mocks
-        mock_connection = Mock()
-        mock_conn.return_value = mock_connection
+        mock_connection = mock_duck
 
         # Create test dataframe
         test_df = pd.DataFrame(
@@ -172,10 +198,9 @@ class TestLoadKaggleData:
                 "Revenue": [50000000.0],
             }
         )
-        mock_read_csv.return_value = test_df
 
         # Execute
-        load_kaggle_data()
+        load_kaggle_data(reader=lambda path: test_df)
 
         # Verify
         assert mock_connection.execute.called
@@ -189,30 +214,29 @@ class TestLoadKaggleData:
 class TestIntegrationWithTestDB:
     """Integration tests using temporary test database."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def test_db(self):
-        """Create temporary test database."""
+        """Create one in-memory test database shared by the whole class."""
         import duckdb
 
-        # Create temp database path (let DuckDB create the file)
-        temp_dir = tempfile.mkdtemp()
-        db_path = Path(temp_dir) / "test.duckdb"
-
-        conn = duckdb.connect(str(db_path))
+        conn = duckdb.connect(":memory:")
         conn.execute("CREATE SCHEMA IF NOT EXISTS raw")
 
         yield conn
 
-        # Cleanup
         conn.close()
-        if db_path.exists():
-            db_path.unlink()
-        Path(temp_dir).rmdir()
 
-    def test_table_creation_in_test_db(self, test_db):
+    @pytest.fixture
+    def clean_db(self, test_db):
+        """Reset the raw schema so each test starts from an empty database."""
+        test_db.execute("DROP SCHEMA IF EXISTS raw CASCADE")
+        test_db.execute("CREATE SCHEMA raw")
+        return test_db
+
+    def test_table_creation_in_test_db(self, clean_db):
         """Test creating tables in a test database."""
         # Create films table
-        test_db.execute(
+        clean_db.execute(
             """
             CREATE TABLE raw.films (
                 id VARCHAR PRIMARY KEY,
@@ -224,7 +248,7 @@ class TestIntegrationWithTestDB:
         )
 
         # Verify table exists
-        result = test_db.execute(
+        result = clean_db.execute(
             """
             SELECT table_name FROM information_schema.tables
             WHERE table_schema = 'raw' AND table_name = 'films'
@@ -234,10 +258,10 @@ class TestIntegrationWithTestDB:
         assert result is not None
         assert result[0] == "films"
 
-    def test_insert_and_query_data(self, test_db):
+    def test_insert_and_query_data(self, clean_db):
         """Test inserting and querying data."""
         # Create table
-        test_db.execute(
+        clean_db.execute(
             """
             CREATE TABLE raw.test_table (
                 id VARCHAR PRIMARY KEY,
@@ -247,21 +271,21 @@ class TestIntegrationWithTestDB:
         )
 
         # Insert data
-        test_db.execute(
+        clean_db.execute(
             "INSERT INTO raw.test_table (id, name) VALUES (?, ?)", ["test-1", "Test Name"]
         )
 
         # Query data
-        result = test_db.execute("SELECT * FROM raw.test_table").fetchone()
+        result = clean_db.execute("SELECT * FROM raw.test_table").fetchone()
 
         assert result is not None
         assert result[0] == "test-1"
         assert result[1] == "Test Name"
 
-    def test_idempotent_loading(self, test_db):
+    def test_idempotent_loading(self, clean_db):
         """Test that tables can be dropped and recreated (idempotent)."""
         # Create table
-        test_db.execute(
+        clean_db.execute(
             """
             CREATE TABLE raw.test_table (
                 id VARCHAR PRIMARY KEY,
@@ -271,13 +295,13 @@ class TestIntegrationWithTestDB:
         )
 
         # Insert data
-        test_db.execute(
+        clean_db.execute(
             "INSERT INTO raw.test_table (id, name) VALUES (?, ?)", ["test-1", "Test Name"]
         )
 
         # Drop and recreate
-        test_db.execute("DROP TABLE IF EXISTS raw.test_table")
-        test_db.execute(
+        clean_db.execute("DROP TABLE IF EXISTS raw.test_table")
+        clean_db.execute(
             """
             CREATE TABLE raw.test_table (
                 id VARCHAR PRIMARY KEY,
@@ -287,5 +311,5 @@ class TestIntegrationWithTestDB:
         )
 
         # Verify table is empty
-        result = test_db.execute("SELECT COUNT(*) FROM raw.test_table").fetchone()
+        result = clean_db.execute("SELECT COUNT(*) FROM raw.test_table").fetchone()
         assert result[0] == 0
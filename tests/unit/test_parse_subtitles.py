@@ -12,20 +12,15 @@ import pytest
 
 from src.nlp.parse_subtitles import (
     clean_dialogue_text,
+    clean_dialogue_texts,
     extract_film_metadata,
     parse_srt_file,
     save_parsed_subtitles,
     validate_parsed_subtitles,
+    validate_parsed_subtitles_batch,
 )
 
-
-class TestParseSrtFile:
-    """Test parse_srt_file function."""
-
-    def test_parse_srt_file_valid(self, tmp_path):
-        """Test parsing valid .srt file."""
-        # Create a valid .srt file
-        srt_content = """1
+VALID_SRT = """1
 00:00:20,000 --> 00:00:24,400
 This is the first subtitle.
 
@@ -38,29 +33,129 @@ It can span multiple lines.
 00:00:28,000 --> 00:00:32,500
 Third subtitle entry.
 """
-        srt_file = tmp_path / "test.srt"
-        srt_file.write_text(srt_content, encoding="utf-8")
 
-        result, skipped = parse_srt_file(str(srt_file))
+HTML_SRT = """1
+00:00:20,000 --> 00:00:24,400
+Subtitles can include <i>formatting</i> tags.
+"""
+
+MALFORMED_SRT = """1
+00:00:20,000 --> 00:00:24,400
+Valid subtitle.
+
+2
+00:00:24,600 -> 00:00:27,800
+Missing arrow in timestamp.
+
+3
+00:00:28,000 --> 00:00:32,500
+Another valid subtitle.
+"""
+
+TWO_ENTRY_SRT = """1
+00:00:20,000 --> 00:00:24,400
+First subtitle.
+
+2
+00:00:24,600 --> 00:00:27,800
+Second subtitle.
+"""
+
+JAPANESE_SRT = """1
+00:00:20,000 --> 00:00:24,400
+千尋、離れないで！
+
+2
+00:00:24,600 --> 00:00:27,800
+怖いよ、お母さん！
+"""
+
+# Pre-encoded payloads so fixtures write bytes without re-encoding per test
+VALID_SRT_BYTES = VALID_SRT.encode("utf-8")
+HTML_SRT_BYTES = HTML_SRT.encode("utf-8")
+MALFORMED_SRT_BYTES = MALFORMED_SRT.encode("utf-8")
+TWO_ENTRY_SRT_BYTES = TWO_ENTRY_SRT.encode("utf-8")
+JAPANESE_SRT_BYTES = JAPANESE_SRT.encode("utf-8")
+MINIMAL_SRT_BYTES = b"1\n00:00:00,000 --> 00:00:01,000\nTest\n"
+CRLF_BOM_HTML_SRT_BYTES = b"\xef\xbb\xbf" + HTML_SRT.replace("\n", "\r\n").encode("utf-8")
+KONNICHIWA_SRT_BYTES = "1\n00:00:20,000 --> 00:00:24,400\nこんにちは\n".encode("utf-8")
+LATIN1_SRT_BYTES = "1\n00:00:00,000 --> 00:00:01,000\nCafé\n".encode("latin-1")
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+VALID_FIXTURE = FIXTURES_DIR / "subtitle_sample_valid.srt"
+INVALID_TIMESTAMPS_FIXTURE = FIXTURES_DIR / "subtitle_sample_invalid_timestamps.srt"
+JAPANESE_FIXTURE = FIXTURES_DIR / "subtitle_sample_japanese.srt"
+
+
+@pytest.fixture(scope="module")
+def srt_dir(tmp_path_factory):
+    """Shared directory for the module's canonical .srt payloads."""
+    return tmp_path_factory.mktemp("srt")
+
+
+def _write_srt(directory, name, payload):
+    path = directory / name
+    path.write_bytes(payload)
+    return path
+
+
+@pytest.fixture(scope="module")
+def valid_srt(srt_dir):
+    """Three-entry .srt file, written once per module."""
+    return _write_srt(srt_dir, "valid.srt", VALID_SRT_BYTES)
+
+
+@pytest.fixture(scope="module")
+def html_srt(srt_dir):
+    """Single-entry .srt file with HTML formatting tags."""
+    return _write_srt(srt_dir, "html.srt", HTML_SRT_BYTES)
+
+
+@pytest.fixture(scope="module")
+def malformed_srt(srt_dir):
+    """.srt file whose second entry has a malformed timestamp arrow."""
+    return _write_srt(srt_dir, "malformed.srt", MALFORMED_SRT_BYTES)
+
+
+@pytest.fixture(scope="module")
+def two_entry_srt(srt_dir):
+    """Two-entry .srt file used by the validation tests."""
+    return _write_srt(srt_dir, "two_entry.srt", TWO_ENTRY_SRT_BYTES)
+
+
+@pytest.fixture(scope="module")
+def japanese_srt(srt_dir):
+    """Two-entry UTF-8 Japanese .srt file."""
+    return _write_srt(srt_dir, "test_ja.srt", JAPANESE_SRT_BYTES)
+
+
+@pytest.fixture(scope="module")
+def bilingual_srt_dir(tmp_path_factory):
+    """Directory holding one minimal English and one minimal Japanese .srt file."""
+    directory = tmp_path_factory.mktemp("bilingual")
+    _write_srt(directory, "film1_ja.srt", MINIMAL_SRT_BYTES)
+    _write_srt(directory, "film1_en.srt", MINIMAL_SRT_BYTES)
+    return directory
+
+
+class TestParseSrtFile:
+    """Test parse_srt_file function."""
+
+    def test_parse_srt_file_valid(self, valid_srt):
+        """Test parsing valid .srt file."""
+        result, skipped = parse_srt_file(str(valid_srt))
 
         assert len(result) == 3
         assert skipped == 0
         assert result[0]["subtitle_index"] == 1
         assert result[0]["start_time"] == 20.0
         assert result[0]["end_time"] == 24.4
-        assert abs(result[0]["duration"] - 4.4) < 0.01  # Floating point tolerance
+        assert result[0]["duration"] == pytest.approx(4.4, abs=0.01)
         assert "first subtitle" in result[0]["dialogue_text"]
 
-    def test_parse_srt_file_with_html_tags(self, tmp_path):
+    def test_parse_srt_file_with_html_tags(self, html_srt):
         """Test parsing .srt file with HTML formatting tags."""
-        srt_content = """1
-00:00:20,000 --> 00:00:24,400
-Subtitles can include <i>formatting</i> tags.
-"""
-        srt_file = tmp_path / "test.srt"
-        srt_file.write_text(srt_content, encoding="utf-8")
-
-        result, skipped = parse_srt_file(str(srt_file))
+        result, skipped = parse_srt_file(str(html_srt))
 
         assert len(result) == 1
         assert skipped == 0
@@ -68,76 +163,79 @@ Subtitles can include <i>formatting</i> tags.
         assert "<i>" not in result[0]["dialogue_text"]
         assert "formatting" in result[0]["dialogue_text"]
 
-    def test_parse_srt_file_malformed_timestamps(self, tmp_path):
+    def test_parse_srt_file_malformed_timestamps(self, malformed_srt):
         """Test handling of malformed timestamp entries."""
-        srt_content = """1
-00:00:20,000 --> 00:00:24,400
-Valid subtitle.
+        result, skipped = parse_srt_file(str(malformed_srt))
 
-2
-00:00:24,600 -> 00:00:27,800
-Missing arrow in timestamp.
+        # Should parse valid entries and skip malformed ones
+        assert len(result) >= 2  # At least 2 valid entries
+        # Note: pysrt may handle some malformed entries differently
 
-3
-00:00:28,000 --> 00:00:32,500
-Another valid subtitle.
-"""
+    def test_parse_srt_file_counts_skipped_blocks(self, malformed_srt):
+        """Test that blocks without a valid timing line are counted as skipped."""
+        result, skipped = parse_srt_file(str(malformed_srt))
+
+        assert [entry["subtitle_index"] for entry in result] == [1, 3]
+        assert skipped == 1
+
+    def test_parse_srt_file_crlf_and_bom(self, tmp_path):
+        """Test parsing a UTF-8 BOM file with Windows line endings."""
         srt_file = tmp_path / "test.srt"
-        srt_file.write_text(srt_content, encoding="utf-8")
+        srt_file.write_bytes(CRLF_BOM_HTML_SRT_BYTES)
 
         result, skipped = parse_srt_file(str(srt_file))
 
-        # Should parse valid entries and skip malformed ones
-        assert len(result) >= 2  # At least 2 valid entries
-        # Note: pysrt may handle some malformed entries differently
+        assert skipped == 0
+        assert result[0]["subtitle_index"] == 1
+        assert result[0]["end_time"] == 24.4
+        assert result[0]["dialogue_text"] == "Subtitles can include formatting tags."
 
 
 class TestCleanDialogueText:
     """Test clean_dialogue_text function."""
 
-    def test_clean_dialogue_text_html_tags(self):
-        """Test HTML tag removal."""
-        text = "<i>This is italic</i> text"
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            pytest.param("<i>This is italic</i> text", "This is italic text", id="html_tags"),
+            pytest.param(
+                "<b>Bold</b> and <i>italic</i> and <u>underline</u>",
+                "Bold and italic and underline",
+                id="multiple_tags",
+            ),
+            pytest.param(
+                "Line one\nLine two\nLine three", "Line one Line two Line three", id="multi_line"
+            ),
+            pytest.param("  Multiple   spaces  ", "Multiple spaces", id="whitespace"),
+            pytest.param("", "", id="empty"),
+            pytest.param("   ", "", id="blank"),
+            pytest.param("<i>Hello</i>\nworld\n  <b>test</b>  ", "Hello world test", id="combined"),
+        ],
+    )
+    def test_clean_dialogue_text(self, text, expected):
+        """Test HTML tag removal, line joining and whitespace normalization."""
         cleaned = clean_dialogue_text(text)
-        assert "<i>" not in cleaned
-        assert "This is italic" in cleaned
 
-    def test_clean_dialogue_text_multiple_tags(self):
-        """Test removal of multiple HTML tags."""
-        text = "<b>Bold</b> and <i>italic</i> and <u>underline</u>"
-        cleaned = clean_dialogue_text(text)
+        assert cleaned == expected
         assert "<" not in cleaned
         assert ">" not in cleaned
-        assert "Bold" in cleaned
-        assert "italic" in cleaned
-
-    def test_clean_dialogue_text_multi_line(self):
-        """Test multi-line dialogue joining."""
-        text = "Line one\nLine two\nLine three"
-        cleaned = clean_dialogue_text(text)
         assert "\n" not in cleaned
-        assert "Line one Line two Line three" == cleaned
 
-    def test_clean_dialogue_text_whitespace(self):
-        """Test whitespace normalization."""
-        text = "  Multiple   spaces  "
-        cleaned = clean_dialogue_text(text)
-        assert cleaned == "Multiple spaces"
-        assert cleaned.count(" ") == 1
-
-    def test_clean_dialogue_text_empty(self):
-        """Test empty string handling."""
-        assert clean_dialogue_text("") == ""
-        assert clean_dialogue_text("   ") == ""
-
-    def test_clean_dialogue_text_combined(self):
-        """Test combination of HTML tags and multi-line text."""
-        text = "<i>Hello</i>\nworld\n  <b>test</b>  "
-        cleaned = clean_dialogue_text(text)
-        assert "<" not in cleaned
-        assert ">" not in cleaned
-        assert "\n" not in cleaned
-        assert cleaned == "Hello world test"
+    @pytest.mark.parametrize(
+        "texts",
+        [
+            pytest.param(
+                ["<i>Hello</i>\nworld", "", "  Multiple   spaces  ", "<b>元気</b>ですか？"],
+                id="mixed",
+            ),
+            pytest.param(["a < b", "<i>c</i> > d"], id="unclosed_tag_across_texts"),
+            pytest.param(["nul\x00inside", "<i>tag</i>"], id="separator_in_text"),
+            pytest.param([], id="empty_batch"),
+        ],
+    )
+    def test_clean_dialogue_texts_matches_single(self, texts):
+        """Test that batch cleaning matches clean_dialogue_text on each text."""
+        assert clean_dialogue_texts(texts) == [clean_dialogue_text(text) for text in texts]
 
 
 class TestExtractFilmMetadata:
@@ -201,8 +299,7 @@ class TestSaveParsedSubtitles:
         save_parsed_subtitles(subtitles, metadata, output_path)
 
         assert Path(output_path).exists()
-        with open(output_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(Path(output_path).read_text(encoding="utf-8"))
         assert "metadata" in data
         assert "subtitles" in data
         assert data["metadata"]["film_name"] == "Test Film"
@@ -218,24 +315,128 @@ class TestSaveParsedSubtitles:
 
         assert Path(output_path).exists()
 
+    def test_save_parsed_subtitles_stdlib_fallback_matches(self, tmp_path, monkeypatch):
+        """Test that the stdlib json fallback writes the same bytes as orjson."""
+        pytest.importorskip("orjson")
+        subtitles = [
+            {
+                "subtitle_index": 1,
+                "start_time": 20.0,
+                "end_time": 24.4,
+                "duration": 4.4,
+                "dialogue_text": "千尋、離れないで！",
+            }
+        ]
+        metadata = {
+            "film_name": "Test",
+            "film_slug": "test_ja",
+            "total_subtitles": 1,
+            "total_duration": 4.4,
+            "parse_timestamp": "2025-01-01T00:00:00",
+        }
+        fast_path = tmp_path / "orjson.json"
+        fallback_path = tmp_path / "stdlib.json"
+
+        save_parsed_subtitles(subtitles, metadata, str(fast_path))
+        monkeypatch.setattr("src.nlp.parse_subtitles.ORJSON_AVAILABLE", False)
+        save_parsed_subtitles(subtitles, metadata, str(fallback_path))
+
+        assert fast_path.read_bytes() == fallback_path.read_bytes()
+
+    def test_save_parsed_subtitles_parquet_round_trip(self, tmp_path):
+        """Test that a .parquet output path writes typed columns plus metadata."""
+        duckdb = pytest.importorskip("duckdb")
+        subtitles = [
+            {
+                "subtitle_index": 1,
+                "start_time": 20.0,
+                "end_time": 24.4,
+                "duration": 4.4,
+                "dialogue_text": "千尋、離れないで！",
+            },
+            {
+                "subtitle_index": 2,
+                "start_time": 24.6,
+                "end_time": 27.8,
+                "duration": 3.2,
+                "dialogue_text": "It's fine.",
+            },
+        ]
+        metadata = {
+            "film_name": "Test's Film",
+            "film_slug": "test_ja",
+            "total_subtitles": 2,
+            "total_duration": 7.8,
+            "parse_timestamp": "2025-01-01T00:00:00",
+        }
+        output_path = tmp_path / "subdir" / "test_parsed.parquet"
+
+        save_parsed_subtitles(subtitles, metadata, str(output_path))
+
+        conn = duckdb.connect(":memory:")
+        try:
+            frame = conn.execute(f"SELECT * FROM '{output_path}'").df()
+            (stored_metadata,) = conn.execute(
+                f"SELECT value FROM parquet_kv_metadata('{output_path}') WHERE key = 'metadata'"
+            ).fetchone()
+        finally:
+            conn.close()
+        assert frame.to_dict(orient="records") == subtitles
+        assert json.loads(stored_metadata.decode("utf-8")) == metadata
+
+    def test_save_parsed_subtitles_parquet_non_numeric_index(self, tmp_path):
+        """Test that non-numeric and missing indexes are stored as NULL, not a failed write."""
+        duckdb = pytest.importorskip("duckdb")
+        subtitles = [
+            {
+                "subtitle_index": index,
+                "start_time": 1.0,
+                "end_time": 2.0,
+                "duration": 1.0,
+                "dialogue_text": "Hello",
+            }
+            for index in (1, "1a", None)
+        ]
+        output_path = tmp_path / "test_parsed.parquet"
+
+        save_parsed_subtitles(subtitles, {"film_name": "Test"}, str(output_path))
+
+        conn = duckdb.connect(":memory:")
+        try:
+            rows = conn.execute(f"SELECT subtitle_index FROM '{output_path}'").fetchall()
+            (column_type,) = conn.execute(
+                f"SELECT column_type FROM (DESCRIBE SELECT * FROM '{output_path}') "
+                "WHERE column_name = 'subtitle_index'"
+            ).fetchone()
+        finally:
+            conn.close()
+        assert rows == [(1,), (None,), (None,)]
+        assert column_type == "INTEGER"
+
+    def test_save_parsed_subtitles_parquet_requires_duckdb_1_1(self, tmp_path, monkeypatch):
+        """Test that an older DuckDB fails with a clear error instead of bad SQL."""
+        duckdb = pytest.importorskip("duckdb")
+        monkeypatch.setattr(duckdb, "__version__", "0.10.3")
+        output_path = tmp_path / "test_parsed.parquet"
+
+        with pytest.raises(RuntimeError, match="duckdb>=1.1"):
+            save_parsed_subtitles([], {"film_name": "Test"}, str(output_path))
+
+        assert not output_path.exists()
+
 
 class TestValidateParsedSubtitles:
     """Test validate_parsed_subtitles function."""
 
-    def test_validate_parsed_subtitles_match(self, tmp_path):
+    @pytest.mark.parametrize(
+        "use_stdlib_json", [pytest.param(False, id="default"), pytest.param(True, id="stdlib_json")]
+    )
+    def test_validate_parsed_subtitles_match(
+        self, tmp_path, two_entry_srt, monkeypatch, use_stdlib_json
+    ):
         """Test validation with matching counts."""
-        # Create .srt file
-        srt_content = """1
-00:00:20,000 --> 00:00:24,400
-First subtitle.
-
-2
-00:00:24,600 --> 00:00:27,800
-Second subtitle.
-"""
-        srt_file = tmp_path / "test.srt"
-        srt_file.write_text(srt_content, encoding="utf-8")
-
+        if use_stdlib_json:
+            monkeypatch.setattr("src.nlp.parse_subtitles.ORJSON_AVAILABLE", False)
         # Create JSON file
         json_data = {
             "metadata": {"total_subtitles": 2, "film_name": "Test", "film_slug": "test_en", "total_duration": 7.8, "parse_timestamp": "2025-01-01T00:00:00"},
@@ -245,30 +446,17 @@ Second subtitle.
             ],
         }
         json_file = tmp_path / "test_parsed.json"
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump(json_data, f)
+        json_file.write_text(json.dumps(json_data), encoding="utf-8")
 
-        result = validate_parsed_subtitles(str(srt_file), str(json_file))
+        result = validate_parsed_subtitles(str(two_entry_srt), str(json_file))
 
         assert result["matched"] is True
         assert result["srt_count"] == 2
         assert result["json_count"] == 2
         assert len(result["spot_check_results"]) > 0
 
-    def test_validate_parsed_subtitles_count_mismatch(self, tmp_path):
+    def test_validate_parsed_subtitles_count_mismatch(self, tmp_path, two_entry_srt):
         """Test validation with mismatched counts."""
-        # Create .srt file with 2 entries
-        srt_content = """1
-00:00:20,000 --> 00:00:24,400
-First subtitle.
-
-2
-00:00:24,600 --> 00:00:27,800
-Second subtitle.
-"""
-        srt_file = tmp_path / "test.srt"
-        srt_file.write_text(srt_content, encoding="utf-8")
-
         # Create JSON file with 1 entry (mismatch)
         json_data = {
             "metadata": {"total_subtitles": 1, "film_name": "Test", "film_slug": "test_en", "total_duration": 4.4, "parse_timestamp": "2025-01-01T00:00:00"},
@@ -277,22 +465,66 @@ Second subtitle.
             ],
         }
         json_file = tmp_path / "test_parsed.json"
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump(json_data, f)
+        json_file.write_text(json.dumps(json_data), encoding="utf-8")
 
-        result = validate_parsed_subtitles(str(srt_file), str(json_file))
+        result = validate_parsed_subtitles(str(two_entry_srt), str(json_file))
 
         assert result["matched"] is False
         assert result["srt_count"] == 2
         assert result["json_count"] == 1
 
+    def test_validate_parsed_subtitles_skips_malformed_blocks(self, tmp_path, malformed_srt):
+        """Test that spot-checks line up with the .srt cues when a block is malformed."""
+        subtitles, _ = parse_srt_file(str(malformed_srt))
+        json_file = tmp_path / "malformed_parsed.json"
+        save_parsed_subtitles(subtitles, extract_film_metadata(str(malformed_srt), subtitles), str(json_file))
+
+        result = validate_parsed_subtitles(str(malformed_srt), str(json_file))
+
+        assert result["matched"] is True
+        assert result["srt_count"] == 2
+        assert sorted(check["index"] for check in result["spot_check_results"]) == [1, 3]
+
+    def test_validate_parsed_subtitles_batch_preserves_order(self, tmp_path):
+        """Test batch validation returns one report per pair, in input order."""
+        pairs = []
+        for count in range(1, 5):
+            srt_file = tmp_path / f"film{count}_en.srt"
+            blocks = (
+                f"{i}\n00:00:0{i},000 --> 00:00:0{i},500\nLine {i}.\n" for i in range(1, count + 1)
+            )
+            srt_file.write_text("\n".join(blocks), encoding="utf-8")
+            subtitles, _ = parse_srt_file(str(srt_file))
+            json_file = tmp_path / f"film{count}_en_parsed.json"
+            metadata = extract_film_metadata(str(srt_file), subtitles)
+            save_parsed_subtitles(subtitles, metadata, str(json_file))
+            pairs.append((str(srt_file), str(json_file)))
+
+        results = validate_parsed_subtitles_batch(pairs, max_workers=4)
+
+        assert [result["srt_count"] for result in results] == [1, 2, 3, 4]
+        assert all(result["matched"] for result in results)
+
+    def test_validate_parsed_subtitles_batch_empty(self):
+        """Test batch validation with no pairs."""
+        assert validate_parsed_subtitles_batch([]) == []
+
+    def test_validate_parsed_subtitles_batch_reports_errors(self, tmp_path):
+        """Test that a pair that cannot be validated is reported, not raised."""
+        missing_json = tmp_path / "missing_parsed.json"
+
+        results = validate_parsed_subtitles_batch([(str(VALID_FIXTURE), str(missing_json))])
+
+        assert results[0]["matched"] is False
+        assert "error" in results[0]
+
 
 class TestIntegrationWithFixtures:
     """Integration tests using test fixtures."""
 
     def test_parse_valid_fixture(self):
         """Test parsing with valid test fixture."""
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "subtitle_sample_valid.srt"
+        fixture_path = VALID_FIXTURE
         if not fixture_path.exists():
             pytest.skip("Fixture file not found")
 
@@ -305,7 +537,7 @@ class TestIntegrationWithFixtures:
 
     def test_parse_invalid_timestamps_fixture(self):
         """Test parsing with invalid timestamps fixture."""
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "subtitle_sample_invalid_timestamps.srt"
+        fixture_path = INVALID_TIMESTAMPS_FIXTURE
         if not fixture_path.exists():
             pytest.skip("Fixture file not found")
 
@@ -320,20 +552,9 @@ class TestIntegrationWithFixtures:
 class TestJapaneseSubtitleProcessing:
     """Test Japanese subtitle file parsing."""
 
-    def test_parse_srt_file_japanese(self, tmp_path):
+    def test_parse_srt_file_japanese(self, japanese_srt):
         """Test parsing Japanese .srt file with UTF-8 encoding."""
-        srt_content = """1
-00:00:20,000 --> 00:00:24,400
-千尋、離れないで！
-
-2
-00:00:24,600 --> 00:00:27,800
-怖いよ、お母さん！
-"""
-        srt_file = tmp_path / "test_ja.srt"
-        srt_file.write_text(srt_content, encoding="utf-8")
-
-        result, skipped = parse_srt_file(str(srt_file), expected_language="ja")
+        result, skipped = parse_srt_file(str(japanese_srt), expected_language="ja")
 
         assert len(result) == 2
         assert skipped == 0
@@ -343,7 +564,7 @@ class TestJapaneseSubtitleProcessing:
 
     def test_parse_japanese_fixture(self):
         """Test parsing with Japanese test fixture."""
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "subtitle_sample_japanese.srt"
+        fixture_path = JAPANESE_FIXTURE
         if not fixture_path.exists():
             pytest.skip("Japanese fixture file not found")
 
@@ -410,12 +631,8 @@ class TestJapaneseSubtitleProcessing:
     def test_encoding_detection_japanese_no_fallback(self, tmp_path):
         """Test that Japanese files require UTF-8 encoding (no Latin-1 fallback)."""
         # Create a file that would decode incorrectly with Latin-1
-        srt_content = """1
-00:00:20,000 --> 00:00:24,400
-こんにちは
-"""
         srt_file = tmp_path / "test_ja.srt"
-        srt_file.write_text(srt_content, encoding="utf-8")
+        srt_file.write_bytes(KONNICHIWA_SRT_BYTES)
 
         # Should parse successfully with UTF-8
         result, skipped = parse_srt_file(str(srt_file), expected_language="ja")
@@ -426,73 +643,65 @@ class TestJapaneseSubtitleProcessing:
 class TestLanguageFiltering:
     """Test language filtering in process_all_subtitles."""
 
-    def test_process_all_subtitles_language_ja(self, tmp_path):
+    def test_process_all_subtitles_language_ja(self, bilingual_srt_dir):
         """Test processing only Japanese files."""
-        # Create test files
-        ja_file = tmp_path / "film1_ja.srt"
-        en_file = tmp_path / "film1_en.srt"
-        ja_file.write_text("1\n00:00:00,000 --> 00:00:01,000\nTest\n", encoding="utf-8")
-        en_file.write_text("1\n00:00:00,000 --> 00:00:01,000\nTest\n", encoding="utf-8")
-
         from src.nlp.parse_subtitles import process_all_subtitles
 
-        results = process_all_subtitles(tmp_path, language="ja")
+        results = process_all_subtitles(bilingual_srt_dir, language="ja")
 
         assert len(results) == 1
         assert results[0]["film_slug"] == "film1_ja"
         assert results[0]["success"] is True
 
-    def test_process_all_subtitles_language_all(self, tmp_path):
+    def test_process_all_subtitles_language_all(self, bilingual_srt_dir):
         """Test processing both English and Japanese files."""
-        # Create test files
-        ja_file = tmp_path / "film1_ja.srt"
-        en_file = tmp_path / "film1_en.srt"
-        ja_file.write_text("1\n00:00:00,000 --> 00:00:01,000\nTest\n", encoding="utf-8")
-        en_file.write_text("1\n00:00:00,000 --> 00:00:01,000\nTest\n", encoding="utf-8")
-
         from src.nlp.parse_subtitles import process_all_subtitles
 
-        results = process_all_subtitles(tmp_path, language="all")
+        results = process_all_subtitles(bilingual_srt_dir, language="all")
 
         assert len(results) == 2
         film_slugs = [r["film_slug"] for r in results]
         assert "film1_ja" in film_slugs
         assert "film1_en" in film_slugs
 
-    def test_process_all_subtitles_backward_compatibility(self, tmp_path):
+    def test_process_all_subtitles_backward_compatibility(self, bilingual_srt_dir):
         """Test default language='en' preserves Story 3.1 behavior."""
-        # Create test files
-        ja_file = tmp_path / "film1_ja.srt"
-        en_file = tmp_path / "film1_en.srt"
-        ja_file.write_text("1\n00:00:00,000 --> 00:00:01,000\nTest\n", encoding="utf-8")
-        en_file.write_text("1\n00:00:00,000 --> 00:00:01,000\nTest\n", encoding="utf-8")
-
         from src.nlp.parse_subtitles import process_all_subtitles
 
-        results = process_all_subtitles(tmp_path, language="en")
+        results = process_all_subtitles(bilingual_srt_dir, language="en")
 
         assert len(results) == 1
         assert results[0]["film_slug"] == "film1_en"
         assert results[0]["success"] is True
 
+    def test_process_all_subtitles_parallel_matches_serial(self, tmp_path):
+        """Test that the process pool returns the same results, in order, as a serial run."""
+        subtitle_dir = tmp_path / "srt"
+        subtitle_dir.mkdir()
+        for slug in ("film1_en", "film2_en", "film3_en"):
+            (subtitle_dir / f"{slug}.srt").write_bytes(MINIMAL_SRT_BYTES)
+        (subtitle_dir / "latin1_en.srt").write_bytes(LATIN1_SRT_BYTES)
+
+        from src.nlp.parse_subtitles import process_all_subtitles
+
+        serial = process_all_subtitles(subtitle_dir, output_dir=tmp_path / "serial", max_workers=1)
+        parallel = process_all_subtitles(
+            subtitle_dir, output_dir=tmp_path / "parallel", max_workers=2
+        )
+
+        def strip_paths(results):
+            return [{k: v for k, v in r.items() if k != "output_path"} for r in results]
+
+        assert len(parallel) == 4
+        assert strip_paths(parallel) == strip_paths(serial)
+        assert all(r["success"] for r in parallel)
+
 
 class TestValidationJapanese:
     """Test validation with Japanese files."""
 
-    def test_validate_parsed_subtitles_japanese(self, tmp_path):
+    def test_validate_parsed_subtitles_japanese(self, tmp_path, japanese_srt):
         """Test validation with Japanese JSON file."""
-        # Create .srt file
-        srt_content = """1
-00:00:20,000 --> 00:00:24,400
-千尋、離れないで！
-
-2
-00:00:24,600 --> 00:00:27,800
-怖いよ、お母さん！
-"""
-        srt_file = tmp_path / "test_ja.srt"
-        srt_file.write_text(srt_content, encoding="utf-8")
-
         # Create JSON file with Japanese metadata
         json_data = {
             "metadata": {
@@ -509,10 +718,9 @@ class TestValidationJapanese:
             ],
         }
         json_file = tmp_path / "test_ja_parsed.json"
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump(json_data, f, ensure_ascii=False)
+        json_file.write_text(json.dumps(json_data, ensure_ascii=False), encoding="utf-8")
 
-        result = validate_parsed_subtitles(str(srt_file), str(json_file))
+        result = validate_parsed_subtitles(str(japanese_srt), str(json_file))
 
         assert result["matched"] is True
         assert result["srt_count"] == 2
@@ -1,12 +1,17 @@
 """Unit tests for prepare_embedding_corpus module."""
 
+import gzip
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, mock_open, patch
+from typing import Any
+from unittest.mock import MagicMock, create_autospec, patch
 
+import duckdb
 import pytest
 
+from src.ai import prepare_embedding_corpus
 from src.ai.prepare_embedding_corpus import (
+    build_corpus,
     chunk_text,
     estimate_tokens,
     extract_character_documents,
@@ -15,10 +20,59 @@ from src.ai.prepare_embedding_corpus import (
     extract_memorable_quotes,
     extract_species_documents,
     save_corpus_to_json,
+    save_corpus_to_jsonl,
     validate_corpus,
 )
 
 
+# Staging tables read by the extract_*_documents functions (columns in query order)
+STAGING_SCHEMA_SQL = """
+    CREATE SCHEMA main_staging;
+    CREATE TABLE main_staging.stg_films (
+        id VARCHAR, title VARCHAR, description VARCHAR, director VARCHAR,
+        release_year INTEGER, rt_score INTEGER, running_time INTEGER
+    );
+    CREATE TABLE main_staging.stg_people (
+        id VARCHAR, name VARCHAR, gender VARCHAR, age VARCHAR,
+        eye_color VARCHAR, hair_color VARCHAR, species_id VARCHAR
+    );
+    CREATE TABLE main_staging.stg_locations (
+        id VARCHAR, name VARCHAR, climate VARCHAR, terrain VARCHAR, surface_water_pct VARCHAR
+    );
+    CREATE TABLE main_staging.stg_species (
+        id VARCHAR, name VARCHAR, classification VARCHAR, eye_colors VARCHAR, hair_colors VARCHAR
+    );
+"""
+
+
+@pytest.fixture(scope="module")
+def staging_db():
+    """One in-memory DuckDB database shared by the module."""
+    conn = duckdb.connect(":memory:")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def duckdb_conn(staging_db):
+    """Reset the staging schema so each test starts from empty tables."""
+    staging_db.execute("DROP SCHEMA IF EXISTS main_staging CASCADE")
+    staging_db.execute(STAGING_SCHEMA_SQL)
+    return staging_db
+
+
+@pytest.fixture
+def mock_conn():
+    """Connection double specced against DuckDBPyConnection, fresh per test."""
+    return create_autospec(duckdb.DuckDBPyConnection, instance=True)
+
+
+def load_fixture_rows(conn, table, rows):
+    """Insert rows (in column order) into a main_staging table."""
+    placeholders = ", ".join("?" for _ in rows[0])
+    conn.executemany(f"INSERT INTO main_staging.{table} VALUES ({placeholders})", rows)
+
+
 class TestTokenEstimation:
     """Test token counting and chunking functionality."""
 
@@ -36,6 +90,40 @@ class TestTokenEstimation:
         token_count = estimate_tokens("")
         assert token_count == 0
 
+    def test_estimate_tokens_falls_back_to_utf8_bytes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the byte-length estimate used when the encoding cannot load."""
+        monkeypatch.setattr("src.ai.prepare_embedding_corpus._get_encoding", lambda model: None)
+
+        assert estimate_tokens("x" * 40) == 10
+        assert estimate_tokens("千尋、離れないで") == 6  # 24 UTF-8 bytes
+        assert estimate_tokens("a") == 1
+
+    def test_estimate_tokens_loads_unavailable_encoding_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a failed encoding load is cached and estimates are not memoized."""
+        encoding_for_model = MagicMock(side_effect=OSError("offline"))
+        monkeypatch.setattr(
+            prepare_embedding_corpus.tiktoken, "encoding_for_model", encoding_for_model
+        )
+        prepare_embedding_corpus._get_encoding.cache_clear()
+        try:
+            for text in ("first text", "second text", "first text"):
+                estimate_tokens(text)
+            encoding_for_model.assert_called_once()
+
+            # Once the encoding loads, the earlier estimate is not served from a cache
+            encoding = MagicMock()
+            encoding.encode_ordinary.return_value = [0] * 7
+            encoding_for_model.side_effect = None
+            encoding_for_model.return_value = encoding
+            prepare_embedding_corpus._get_encoding.cache_clear()
+            assert estimate_tokens("first text") == 7
+        finally:
+            prepare_embedding_corpus._get_encoding.cache_clear()
+
     def test_chunk_text_short_text(self) -> None:
         """Test that short text is not chunked."""
         text = "This is a short sentence."
@@ -59,32 +147,34 @@ class TestTokenEstimation:
 class TestFilmExtraction:
     """Test film document extraction."""
 
-    def test_extract_film_documents_success(self) -> None:
+    def test_extract_film_documents_success(self, duckdb_conn: duckdb.DuckDBPyConnection) -> None:
         """Test successful film extraction."""
-        # Mock connection
-        mock_conn = MagicMock()
-        mock_conn.execute.return_value.fetchall.return_value = [
-            (
-                "film1",
-                "Spirited Away",
-                "A young girl enters a magical world",
-                "Hayao Miyazaki",
-                2001,
-                97,
-                125,
-            ),
-            (
-                "film2",
-                "My Neighbor Totoro",
-                "Two sisters encounter forest spirits",
-                "Hayao Miyazaki",
-                1988,
-                93,
-                86,
-            ),
-        ]
+        load_fixture_rows(
+            duckdb_conn,
+            "stg_films",
+            [
+                (
+                    "film1",
+                    "Spirited Away",
+                    "A young girl enters a magical world",
+                    "Hayao Miyazaki",
+                    2001,
+                    97,
+                    125,
+                ),
+                (
+                    "film2",
+                    "My Neighbor Totoro",
+                    "Two sisters encounter forest spirits",
+                    "Hayao Miyazaki",
+                    1988,
+                    93,
+                    86,
+                ),
+            ],
+        )
 
-        documents = extract_film_documents(mock_conn)
+        documents = extract_film_documents(duckdb_conn)
 
         assert len(documents) == 2
         assert documents[0]["doc_id"] == "film_film1"
@@ -93,16 +183,23 @@ class TestFilmExtraction:
         assert "magical world" in documents[0]["text"]
         assert documents[0]["metadata"]["director"] == "Hayao Miyazaki"
         assert documents[0]["metadata"]["release_year"] == 2001
+        # Repeated directors share one interned string
+        assert documents[0]["metadata"]["director"] is documents[1]["metadata"]["director"]
 
-    def test_extract_film_documents_missing_description(self) -> None:
+    def test_extract_film_documents_missing_description(
+        self, duckdb_conn: duckdb.DuckDBPyConnection
+    ) -> None:
         """Test synthetic description generation for missing descriptions."""
-        mock_conn = MagicMock()
-        mock_conn.execute.return_value.fetchall.return_value = [
-            ("film1", "Castle in the Sky", "", "Hayao Miyazaki", 1986, 95, 124),
-            ("film2", "Ponyo", None, "Hayao Miyazaki", 2008, 92, 101),
-        ]
+        load_fixture_rows(
+            duckdb_conn,
+            "stg_films",
+            [
+                ("film1", "Castle in the Sky", "", "Hayao Miyazaki", 1986, 95, 124),
+                ("film2", "Ponyo", None, "Hayao Miyazaki", 2008, 92, 101),
+            ],
+        )
 
-        documents = extract_film_documents(mock_conn)
+        documents = extract_film_documents(duckdb_conn)
 
         assert len(documents) == 2
         # Synthetic description should contain title, year, and director
@@ -110,18 +207,16 @@ class TestFilmExtraction:
         assert "1986" in documents[0]["text"]
         assert "Hayao Miyazaki" in documents[0]["text"]
 
-    def test_extract_film_documents_empty_database(self) -> None:
+    def test_extract_film_documents_empty_database(
+        self, duckdb_conn: duckdb.DuckDBPyConnection
+    ) -> None:
         """Test handling of empty database."""
-        mock_conn = MagicMock()
-        mock_conn.execute.return_value.fetchall.return_value = []
-
-        documents = extract_film_documents(mock_conn)
+        documents = extract_film_documents(duckdb_conn)
 
         assert len(documents) == 0
 
-    def test_extract_film_documents_database_error(self) -> None:
+    def test_extract_film_documents_database_error(self, mock_conn: MagicMock) -> None:
         """Test handling of database errors."""
-        mock_conn = MagicMock()
         mock_conn.execute.side_effect = Exception("Database error")
 
         documents = extract_film_documents(mock_conn)
@@ -132,15 +227,20 @@ class TestFilmExtraction:
 class TestCharacterExtraction:
     """Test character document extraction."""
 
-    def test_extract_character_documents_success(self) -> None:
+    def test_extract_character_documents_success(
+        self, duckdb_conn: duckdb.DuckDBPyConnection
+    ) -> None:
         """Test successful character extraction."""
-        mock_conn = MagicMock()
-        mock_conn.execute.return_value.fetchall.return_value = [
-            ("char1", "Chihiro", "Female", "10", "Brown", "Brown", "Human"),
-            ("char2", "Haku", "Male", "12", "Green", "Green", "Dragon"),
-        ]
+        load_fixture_rows(
+            duckdb_conn,
+            "stg_people",
+            [
+                ("char1", "Chihiro", "Female", "10", "Brown", "Brown", "Human"),
+                ("char2", "Haku", "Male", "12", "Green", "Green", "Dragon"),
+            ],
+        )
 
-        documents = extract_character_documents(mock_conn)
+        documents = extract_character_documents(duckdb_conn)
 
         assert len(documents) == 2
         assert documents[0]["doc_id"] == "character_char1"
@@ -150,14 +250,19 @@ class TestCharacterExtraction:
         assert "Female" in documents[0]["text"]
         assert documents[0]["metadata"]["gender"] == "Female"
 
-    def test_extract_character_documents_null_fields(self) -> None:
+    def test_extract_character_documents_null_fields(
+        self, duckdb_conn: duckdb.DuckDBPyConnection
+    ) -> None:
         """Test character extraction with NULL fields."""
-        mock_conn = MagicMock()
-        mock_conn.execute.return_value.fetchall.return_value = [
-            ("char1", "No-Face", None, None, None, None, "Spirit"),
-        ]
+        load_fixture_rows(
+            duckdb_conn,
+            "stg_people",
+            [
+                ("char1", "No-Face", None, None, None, None, "Spirit"),
+            ],
+        )
 
-        documents = extract_character_documents(mock_conn)
+        documents = extract_character_documents(duckdb_conn)
 
         assert len(documents) == 1
         assert "No-Face is a character" in documents[0]["text"]
@@ -165,7 +270,7 @@ class TestCharacterExtraction:
         # NULL fields should not appear in text
         assert "None" not in documents[0]["text"]
 
-    def test_extract_character_documents_chunking(self) -> None:
+    def test_extract_character_documents_chunking(self, mock_conn: MagicMock) -> None:
         """Test that long character bios are chunked."""
         # Create a very long bio that will need chunking
         long_bio_char = (
@@ -178,7 +283,6 @@ class TestCharacterExtraction:
             " ".join(["Species"] * 100),  # Make species field very long
         )
 
-        mock_conn = MagicMock()
         mock_conn.execute.return_value.fetchall.return_value = [long_bio_char]
 
         documents = extract_character_documents(mock_conn)
@@ -194,15 +298,20 @@ class TestCharacterExtraction:
 class TestLocationExtraction:
     """Test location document extraction."""
 
-    def test_extract_location_documents_success(self) -> None:
+    def test_extract_location_documents_success(
+        self, duckdb_conn: duckdb.DuckDBPyConnection
+    ) -> None:
         """Test successful location extraction."""
-        mock_conn = MagicMock()
-        mock_conn.execute.return_value.fetchall.return_value = [
-            ("loc1", "Bathhouse", "Temperate", "Mountain", "40-60%"),
-            ("loc2", "Forest", "Tropical", "Forest", "70-90%"),
-        ]
+        load_fixture_rows(
+            duckdb_conn,
+            "stg_locations",
+            [
+                ("loc1", "Bathhouse", "Temperate", "Mountain", "40-60%"),
+                ("loc2", "Forest", "Tropical", "Forest", "70-90%"),
+            ],
+        )
 
-        documents = extract_location_documents(mock_conn)
+        documents = extract_location_documents(duckdb_conn)
 
         assert len(documents) == 2
         assert documents[0]["doc_id"] == "location_loc1"
@@ -211,14 +320,19 @@ class TestLocationExtraction:
         assert "Bathhouse is a location" in documents[0]["text"]
         assert "Temperate" in documents[0]["text"]
 
-    def test_extract_location_documents_partial_data(self) -> None:
+    def test_extract_location_documents_partial_data(
+        self, duckdb_conn: duckdb.DuckDBPyConnection
+    ) -> None:
         """Test location extraction with partial data."""
-        mock_conn = MagicMock()
-        mock_conn.execute.return_value.fetchall.return_value = [
-            ("loc1", "Unknown Place", None, "Desert", None),
-        ]
+        load_fixture_rows(
+            duckdb_conn,
+            "stg_locations",
+            [
+                ("loc1", "Unknown Place", None, "Desert", None),
+            ],
+        )
 
-        documents = extract_location_documents(mock_conn)
+        documents = extract_location_documents(duckdb_conn)
 
         assert len(documents) == 1
         assert "Unknown Place" in documents[0]["text"]
@@ -229,15 +343,20 @@ class TestLocationExtraction:
 class TestSpeciesExtraction:
     """Test species document extraction."""
 
-    def test_extract_species_documents_success(self) -> None:
+    def test_extract_species_documents_success(
+        self, duckdb_conn: duckdb.DuckDBPyConnection
+    ) -> None:
         """Test successful species extraction."""
-        mock_conn = MagicMock()
-        mock_conn.execute.return_value.fetchall.return_value = [
-            ("spec1", "Human", "Mammal", "Brown, Blue, Green", "Black, Brown, Blonde"),
-            ("spec2", "Spirit", "Supernatural", "Various", "Various"),
-        ]
+        load_fixture_rows(
+            duckdb_conn,
+            "stg_species",
+            [
+                ("spec1", "Human", "Mammal", "Brown, Blue, Green", "Black, Brown, Blonde"),
+                ("spec2", "Spirit", "Supernatural", "Various", "Various"),
+            ],
+        )
 
-        documents = extract_species_documents(mock_conn)
+        documents = extract_species_documents(duckdb_conn)
 
         assert len(documents) == 2
         assert documents[0]["doc_id"] == "species_spec1"
@@ -250,14 +369,17 @@ class TestSpeciesExtraction:
 class TestMemorableQuotes:
     """Test memorable quote extraction."""
 
-    @patch("src.ai.prepare_embedding_corpus.Path")
-    @patch("builtins.open", new_callable=mock_open)
+    @pytest.fixture
+    def subtitles_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Point the quote extractor at an empty temporary subtitles directory."""
+        monkeypatch.setattr("src.ai.prepare_embedding_corpus.SUBTITLES_DIR", tmp_path)
+        return tmp_path
+
     def test_extract_memorable_quotes_success(
-        self, mock_file: MagicMock, mock_path: MagicMock
+        self, subtitles_dir: Path, mock_conn: MagicMock
     ) -> None:
         """Test successful quote extraction."""
         # Mock database results
-        mock_conn = MagicMock()
         mock_conn.execute.return_value.fetchall.return_value = [
             (
                 "film1",
@@ -273,23 +395,22 @@ class TestMemorableQuotes:
             ),
         ]
 
-        # Mock subtitle file
-        mock_path.return_value.exists.return_value = True
-        mock_subtitle_data = {
+        # Parsed subtitle file for the film
+        subtitle_data = {
             "metadata": {"film_name": "Spirited Away"},
             "subtitles": [
                 {"start_time": 2700, "end_time": 2705, "dialogue_text": "Hello!"},
                 {"start_time": 2710, "end_time": 2715, "dialogue_text": "How are you?"},
             ],
         }
-        mock_file.return_value.__enter__.return_value.read.return_value = json.dumps(
-            mock_subtitle_data
+        (subtitles_dir / "spirited_away_parsed.json").write_text(
+            json.dumps(subtitle_data), encoding="utf-8"
         )
 
-        with patch("json.load", return_value=mock_subtitle_data):
-            documents = extract_memorable_quotes(mock_conn, max_quotes_per_film=50)
+        documents = extract_memorable_quotes(mock_conn, max_quotes_per_film=50)
 
-        assert len(documents) >= 0  # May be 0 if minute filtering doesn't match
+        assert len(documents) == 1
+        assert documents[0]["text"] == "Hello! How are you?"
         # If documents were extracted, validate structure
         for doc in documents:
             assert doc["type"] == "quote"
@@ -299,25 +420,49 @@ class TestMemorableQuotes:
             if "emotion_joy" in doc["metadata"]:
                 assert isinstance(doc["metadata"]["emotion_joy"], float)
 
-    @patch("src.ai.prepare_embedding_corpus.Path")
-    def test_extract_memorable_quotes_missing_file(self, mock_path: MagicMock) -> None:
+    def test_extract_memorable_quotes_loads_each_film_once(
+        self, subtitles_dir: Path, mock_conn: MagicMock
+    ) -> None:
+        """Test that several peaks from one film share a single subtitle load."""
+        mock_conn.execute.return_value.fetchall.return_value = [
+            ("film1", "spirited_away_en", "en", 45, 0.85, 0.12, 0.05, 0.22, 0.08, 1.32),
+            ("film1", "spirited_away_en", "en", 46, 0.40, 0.10, 0.05, 0.20, 0.05, 0.80),
+        ]
+        subtitle_data = {
+            "metadata": {"film_name": "Spirited Away"},
+            "subtitles": [
+                {"start_time": 2700, "end_time": 2705, "dialogue_text": "Hello!"},
+                {"start_time": 2770, "end_time": 2775, "dialogue_text": "Goodbye!"},
+            ],
+        }
+        (subtitles_dir / "spirited_away_en_parsed.json").write_text(
+            json.dumps(subtitle_data), encoding="utf-8"
+        )
+
+        with patch(
+            "src.ai.prepare_embedding_corpus._load_subtitle_json",
+            wraps=prepare_embedding_corpus._load_subtitle_json,
+        ) as load_spy:
+            documents = extract_memorable_quotes(mock_conn)
+
+        assert [doc["text"] for doc in documents] == ["Hello!", "Goodbye!"]
+        load_spy.assert_called_once()
+
+    def test_extract_memorable_quotes_missing_file(
+        self, subtitles_dir: Path, mock_conn: MagicMock
+    ) -> None:
         """Test handling of missing subtitle files."""
-        mock_conn = MagicMock()
         mock_conn.execute.return_value.fetchall.return_value = [
             ("film1", "missing_film", "en", 45, 0.85, 0.12, 0.05, 0.22, 0.08, 1.32),
         ]
 
-        # Mock file doesn't exist
-        mock_path.return_value.exists.return_value = False
-
         documents = extract_memorable_quotes(mock_conn)
 
-        # Should handle gracefully and return empty or partial results
-        assert isinstance(documents, list)
+        # Peaks without a parsed subtitle file are skipped
+        assert documents == []
 
-    def test_extract_memorable_quotes_database_error(self) -> None:
+    def test_extract_memorable_quotes_database_error(self, mock_conn: MagicMock) -> None:
         """Test handling of database errors."""
-        mock_conn = MagicMock()
         mock_conn.execute.side_effect = Exception("Database error")
 
         documents = extract_memorable_quotes(mock_conn)
@@ -387,6 +532,37 @@ class TestCorpusValidation:
 
         assert validation["empty_text_count"] == 1
 
+    def test_validate_corpus_reuses_recorded_token_counts(self) -> None:
+        """Test that exact token counts are stored on documents and not recomputed."""
+        documents = [
+            {"doc_id": "film_1", "type": "film", "name": "A", "text": "Hello!", "metadata": {}},
+            {"doc_id": "film_2", "type": "film", "name": "B", "text": "Bye", "metadata": {}},
+        ]
+        encoding = MagicMock()
+        encoding.encode_ordinary_batch.side_effect = lambda texts: [[0] * len(t) for t in texts]
+
+        with patch("src.ai.prepare_embedding_corpus._get_encoding", return_value=encoding):
+            first = validate_corpus(documents)
+        assert [doc["_token_count"] for doc in documents] == [6, 3]
+
+        with patch("src.ai.prepare_embedding_corpus._get_encoding") as get_encoding:
+            second = validate_corpus(documents)
+
+        get_encoding.assert_not_called()
+        assert second["avg_tokens_by_type"] == first["avg_tokens_by_type"] == {"film": 4.5}
+
+    def test_validate_corpus_does_not_record_fallback_estimates(self) -> None:
+        """Test that byte-based estimates are used for stats but never stored."""
+        documents = [
+            {"doc_id": "film_1", "type": "film", "name": "A", "text": "Hello!", "metadata": {}},
+        ]
+
+        with patch("src.ai.prepare_embedding_corpus._get_encoding", return_value=None):
+            validation = validate_corpus(documents)
+
+        assert validation["avg_tokens_by_type"]["film"] > 0
+        assert "_token_count" not in documents[0]
+
     def test_validate_corpus_empty_list(self) -> None:
         """Test validation with empty corpus."""
         validation = validate_corpus([])
@@ -398,11 +574,7 @@ class TestCorpusValidation:
 class TestCorpusSaving:
     """Test corpus saving functionality."""
 
-    @patch("src.ai.prepare_embedding_corpus.Path")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_save_corpus_to_json_success(
-        self, mock_file: MagicMock, mock_path: MagicMock
-    ) -> None:
+    def test_save_corpus_to_json_success(self, tmp_path: Path) -> None:
         """Test successful corpus save."""
         documents = [
             {
@@ -413,59 +585,118 @@ class TestCorpusSaving:
                 "metadata": {},
             }
         ]
+        output_path = tmp_path / "test_output.json"
 
-        # Mock Path operations
-        mock_path_instance = MagicMock()
-        mock_path_instance.parent.mkdir = MagicMock()
-        mock_path.return_value = mock_path_instance
-
-        save_corpus_to_json(documents, "test_output.json")
+        save_corpus_to_json(documents, output_path)
 
-        # Verify file was opened for writing
-        mock_file.assert_called_once()
+        assert json.loads(output_path.read_text(encoding="utf-8")) == documents
 
-    @patch("src.ai.prepare_embedding_corpus.Path")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_save_corpus_to_json_creates_directory(
-        self, mock_file: MagicMock, mock_path: MagicMock
+    def test_save_corpus_to_json_stdlib_fallback_matches(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
+        """Test that the stdlib json fallback writes the same bytes as orjson."""
+        pytest.importorskip("orjson")
+        documents = [
+            {
+                "doc_id": "quote_1",
+                "type": "quote",
+                "name": "千と千尋の神隠し",
+                "text": "千尋、離れないで！",
+                "metadata": {"intensity": 0.875, "release_year": 2001, "director": None},
+            }
+        ]
+        fast_path = tmp_path / "orjson.json"
+        fallback_path = tmp_path / "stdlib.json"
+
+        save_corpus_to_json(documents, str(fast_path))
+        monkeypatch.setattr("src.ai.prepare_embedding_corpus.ORJSON_AVAILABLE", False)
+        save_corpus_to_json(documents, str(fallback_path))
+
+        assert fast_path.read_bytes() == fallback_path.read_bytes()
+        assert json.loads(fast_path.read_text(encoding="utf-8")) == documents
+
+    @pytest.mark.parametrize(
+        "use_stdlib_json", [pytest.param(False, id="default"), pytest.param(True, id="stdlib_json")]
+    )
+    @pytest.mark.parametrize("filename", ["corpus.jsonl", "corpus.jsonl.gz"])
+    def test_save_corpus_to_jsonl_streaming(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        filename: str,
+        use_stdlib_json: bool,
+    ) -> None:
+        """Test that JSON Lines output holds one document per line, streamed from a generator."""
+        if use_stdlib_json:
+            monkeypatch.setattr("src.ai.prepare_embedding_corpus.ORJSON_AVAILABLE", False)
+        documents = [
+            {"doc_id": "film_1", "type": "film", "name": "Test", "text": "千尋", "metadata": {}},
+            {
+                "doc_id": "quote_1",
+                "type": "quote",
+                "name": "Q",
+                "text": "Hi",
+                "metadata": {"x": 0.5},
+            },
+        ]
+        output_path = tmp_path / "out" / filename
+
+        save_corpus_to_jsonl((doc for doc in documents), str(output_path))
+
+        raw = output_path.read_bytes()
+        if filename.endswith(".gz"):
+            raw = gzip.decompress(raw)
+        lines = raw.decode("utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == documents
+        assert not list(output_path.parent.glob("*.tmp"))
+
+    @pytest.mark.parametrize(
+        "save, filename",
+        [(save_corpus_to_json, "corpus.json"), (save_corpus_to_jsonl, "corpus.jsonl")],
+    )
+    def test_save_corpus_omits_private_keys(self, tmp_path: Path, save: Any, filename: str) -> None:
+        """Test that token counts recorded by validate_corpus are not saved."""
+        document = {"doc_id": "film_1", "type": "film", "text": "Hi", "metadata": {}}
+        output_path = tmp_path / filename
+
+        save([{**document, "_token_count": 1}], output_path)
+
+        text = output_path.read_text(encoding="utf-8")
+        saved = json.loads(text) if filename.endswith(".json") else [json.loads(text)]
+        assert saved == [document]
+
+    def test_save_corpus_to_json_creates_directory(self, tmp_path: Path) -> None:
         """Test that save creates output directory."""
         documents = [{"doc_id": "test", "type": "film", "text": "test", "metadata": {}}]
+        output_path = tmp_path / "new" / "dir" / "output.json"
 
-        mock_path_instance = MagicMock()
-        mock_path.return_value = mock_path_instance
-
-        save_corpus_to_json(documents, "new/dir/output.json")
+        save_corpus_to_json(documents, str(output_path))
 
-        # Verify mkdir was called
-        mock_path_instance.parent.mkdir.assert_called_once_with(
-            parents=True, exist_ok=True
-        )
+        assert output_path.is_file()
 
-    @patch("src.ai.prepare_embedding_corpus.Path")
-    @patch("builtins.open", side_effect=IOError("Write failed"))
     def test_save_corpus_to_json_error(
-        self, mock_file: MagicMock, mock_path: MagicMock
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test handling of write errors."""
         documents = [{"doc_id": "test", "type": "film", "text": "test", "metadata": {}}]
 
-        mock_path_instance = MagicMock()
-        mock_path.return_value = mock_path_instance
+        def raise_ioerror(*args: Any, **kwargs: Any) -> None:
+            raise IOError("Write failed")
+
+        monkeypatch.setattr(Path, "write_bytes", raise_ioerror)
+        monkeypatch.setattr(Path, "write_text", raise_ioerror)
 
         with pytest.raises(IOError):
-            save_corpus_to_json(documents, "output.json")
+            save_corpus_to_json(documents, tmp_path / "output.json")
 
 
 class TestIntegration:
     """Integration tests (optional, can be run with real database)."""
 
-    def test_document_structure_consistency(self) -> None:
+    def test_document_structure_consistency(self, mock_conn: MagicMock) -> None:
         """Test that all extraction functions return consistent document structure."""
         required_fields = ["doc_id", "type", "name", "text", "metadata"]
 
-        mock_conn = MagicMock()
-
         # Test each extraction function with empty results
         mock_conn.execute.return_value.fetchall.return_value = []
 
@@ -479,3 +710,32 @@ class TestIntegration:
             for doc in documents:
                 for field in required_fields:
                     assert field in doc, f"Missing field {field} in {func.__name__}"
+
+    def test_build_corpus_matches_sequential_order(self, mock_conn: MagicMock) -> None:
+        """Test that concurrent extraction returns documents in extractor order."""
+        rows_by_table = {
+            "stg_films": [
+                ("film1", "Spirited Away", "A magical world", "Hayao Miyazaki", 2001, 97, 125)
+            ],
+            "stg_people": [],
+            "stg_locations": [("loc1", "Bathhouse", "Temperate", "Mountain", "40-60%")],
+            "stg_species": [("spec1", "Spirit", "Supernatural", "Various", "Various")],
+        }
+
+        def execute(query: str) -> MagicMock:
+            result = MagicMock()
+            table = next(name for name in rows_by_table if name in query)
+            result.fetchall.return_value = rows_by_table[table]
+            return result
+
+        mock_conn.cursor.return_value.execute.side_effect = execute
+
+        documents = build_corpus(mock_conn)
+
+        assert [doc["doc_id"] for doc in documents] == [
+            "film_film1",
+            "location_loc1",
+            "species_spec1",
+        ]
+        assert mock_conn.cursor.return_value.close.call_count == 4
+        mock_conn.execute.assert_not_called()
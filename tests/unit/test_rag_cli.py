@@ -7,10 +7,13 @@ special command handling, query processing, and error handling.
 
 import json
 import os
-import tempfile
-from datetime import datetime, timedelta
-from typing import Any, Dict
-from unittest.mock import MagicMock, patch
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
 
@@ -21,18 +24,22 @@ from src.ai.rag_cli import (
     parse_arguments,
     print_with_streaming,
     process_query,
+    query_rag_system,
     save_conversation_history,
 )
 from src.shared.exceptions import DatabaseError, RAGError, RateLimitError
 
+# One character over process_query's 1000-character input limit
+LONG_QUERY_OVER_LIMIT = "a" * 1001
+
 
 # Fixtures
 
 
-@pytest.fixture
-def sample_rag_response() -> Dict[str, Any]:
-    """Mock RAG pipeline response for unit tests."""
-    return {
+@pytest.fixture(scope="session")
+def sample_rag_response() -> Mapping[str, Any]:
+    """Mock RAG pipeline response for unit tests (read-only, shared by all tests)."""
+    response = {
         "answer": (
             "Based on my graph analysis, the most central characters are "
             "Chihiro, Pazu, and Ashitaka."
@@ -51,6 +58,15 @@ def sample_rag_response() -> Dict[str, Any]:
         "response_time": 2.3,
         "cost": 0.0127,
     }
+    return MappingProxyType(response)
+
+
+@pytest.fixture
+def mock_query(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Autospecced stand-in for query_rag_system, installed in the CLI module."""
+    mock = create_autospec(query_rag_system)
+    monkeypatch.setattr("src.ai.rag_cli.query_rag_system", mock)
+    return mock
 
 
 @pytest.fixture
@@ -69,35 +85,35 @@ def sample_session() -> ConversationSession:
 # Test Argument Parsing
 
 
-def test_parse_arguments_defaults() -> None:
+def test_parse_arguments_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test default argument values."""
-    with patch("sys.argv", ["rag_cli.py"]):
-        args = parse_arguments()
-        assert args.debug is False
-        assert args.no_streaming is False
-        assert args.log_level == "INFO"
-        assert args.save_history is True
+    monkeypatch.setattr(sys, "argv", ["rag_cli.py"])
+    args = parse_arguments()
+    assert args.debug is False
+    assert args.no_streaming is False
+    assert args.log_level == "INFO"
+    assert args.save_history is True
 
 
-def test_parse_arguments_debug_flag() -> None:
+def test_parse_arguments_debug_flag(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test --debug flag sets debug mode."""
-    with patch("sys.argv", ["rag_cli.py", "--debug"]):
-        args = parse_arguments()
-        assert args.debug is True
+    monkeypatch.setattr(sys, "argv", ["rag_cli.py", "--debug"])
+    args = parse_arguments()
+    assert args.debug is True
 
 
-def test_parse_arguments_no_streaming_flag() -> None:
+def test_parse_arguments_no_streaming_flag(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test --no-streaming flag disables streaming."""
-    with patch("sys.argv", ["rag_cli.py", "--no-streaming"]):
-        args = parse_arguments()
-        assert args.no_streaming is True
+    monkeypatch.setattr(sys, "argv", ["rag_cli.py", "--no-streaming"])
+    args = parse_arguments()
+    assert args.no_streaming is True
 
 
-def test_parse_arguments_log_level() -> None:
+def test_parse_arguments_log_level(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test --log-level sets logging level."""
-    with patch("sys.argv", ["rag_cli.py", "--log-level", "DEBUG"]):
-        args = parse_arguments()
-        assert args.log_level == "DEBUG"
+    monkeypatch.setattr(sys, "argv", ["rag_cli.py", "--log-level", "DEBUG"])
+    args = parse_arguments()
+    assert args.log_level == "DEBUG"
 
 
 # Test ConversationSession
@@ -188,15 +204,6 @@ def test_conversation_session_get_stats_empty() -> None:
 # Test Special Command Handling
 
 
-def test_handle_special_command_exit() -> None:
-    """Test /exit command returns exit signal."""
-    session = ConversationSession()
-
-    result = handle_special_command("/exit", session)
-
-    assert result == "exit"
-
-
 def test_handle_special_command_reset(capsys: Any) -> None:
     """Test /reset command clears session."""
     session = ConversationSession()
@@ -226,37 +233,34 @@ def test_handle_special_command_stats(capsys: Any, sample_session: ConversationS
     assert "$0.01" in captured.out
 
 
-def test_handle_special_command_help(capsys: Any) -> None:
-    """Test /help command displays help message."""
-    session = ConversationSession()
-
-    result = handle_special_command("/help", session)
-
-    assert result is None
-
-    captured = capsys.readouterr()
-    assert "SpiritedData RAG CLI" in captured.out
-    assert "Try asking:" in captured.out
-
-
-def test_handle_special_command_unknown(capsys: Any) -> None:
-    """Test unknown command shows error message."""
+@pytest.mark.parametrize(
+    "command, expected_result, expected_out",
+    [
+        pytest.param("/exit", "exit", (), id="exit"),
+        pytest.param("/help", None, ("SpiritedData RAG CLI", "Try asking:"), id="help"),
+        pytest.param("/unknown", None, ("Unknown command",), id="unknown"),
+    ],
+)
+def test_handle_special_command(
+    command: str, expected_result: Any, expected_out: tuple, capsys: Any
+) -> None:
+    """Test stateless commands return the right signal and print their message."""
     session = ConversationSession()
 
-    result = handle_special_command("/unknown", session)
+    result = handle_special_command(command, session)
 
-    assert result is None
+    assert result == expected_result
 
     captured = capsys.readouterr()
-    assert "Unknown command" in captured.out
+    for text in expected_out:
+        assert text in captured.out
 
 
 # Test Query Processing
 
 
-@patch("src.ai.rag_cli.query_rag_system")
 def test_process_query_success(
-    mock_query: MagicMock, sample_rag_response: Dict[str, Any], capsys: Any
+    mock_query: MagicMock, sample_rag_response: Mapping[str, Any], capsys: Any
 ) -> None:
     """Test successful query processing."""
     mock_query.return_value = sample_rag_response
@@ -286,9 +290,8 @@ def test_process_query_success(
     assert "Chihiro" in captured.out
 
 
-@patch("src.ai.rag_cli.query_rag_system")
 def test_process_query_debug_mode(
-    mock_query: MagicMock, sample_rag_response: Dict[str, Any], capsys: Any
+    mock_query: MagicMock, sample_rag_response: Mapping[str, Any], capsys: Any
 ) -> None:
     """Test query processing with debug mode enabled."""
     mock_query.return_value = sample_rag_response
@@ -319,15 +322,13 @@ def test_process_query_empty_input() -> None:
 def test_process_query_too_long_input() -> None:
     """Test query processing rejects input > 1000 characters."""
     session = ConversationSession()
-    long_query = "a" * 1001
 
     with pytest.raises(ValueError, match="Query too long"):
-        process_query(long_query, session)
+        process_query(LONG_QUERY_OVER_LIMIT, session)
 
 
-@patch("src.ai.rag_cli.query_rag_system")
 def test_process_query_whitespace_stripped(
-    mock_query: MagicMock, sample_rag_response: Dict[str, Any]
+    mock_query: MagicMock, sample_rag_response: Mapping[str, Any]
 ) -> None:
     """Test query processing strips whitespace."""
     mock_query.return_value = sample_rag_response
@@ -343,66 +344,47 @@ def test_process_query_whitespace_stripped(
 # Test Streaming Output
 
 
-def test_print_with_streaming(capsys: Any) -> None:
-    """Test streaming output function."""
-    print_with_streaming("Hello world test", delay=0.001)
+def test_print_with_streaming(capsys: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test streaming output function pauses once per word without real sleeps."""
+    sleeps = []
+    monkeypatch.setattr("src.ai.rag_cli.time.sleep", sleeps.append)
+
+    print_with_streaming("Hello world test", delay=1.0)
 
     captured = capsys.readouterr()
     assert "Hello world test" in captured.out
+    assert sleeps == [1.0, 1.0, 1.0]
 
 
 # Test Error Handling
 
 
-def test_handle_error_rag_error(capsys: Any) -> None:
-    """Test handling RAGError."""
-    error = RAGError("OpenAI API is unavailable")
-
-    handle_error(error, debug=False)
-
-    captured = capsys.readouterr()
-    assert "❌ RAG System Error" in captured.out
-    assert "OpenAI API is unavailable" in captured.out
-
-
-def test_handle_error_rate_limit(capsys: Any) -> None:
-    """Test handling RateLimitError."""
-    error = RateLimitError("Rate limit exceeded")
-
-    handle_error(error, debug=False)
-
-    captured = capsys.readouterr()
-    assert "⚠️ Rate Limit Exceeded" in captured.out
-
-
-def test_handle_error_database_error(capsys: Any) -> None:
-    """Test handling DatabaseError."""
-    error = DatabaseError("Database connection failed")
-
-    handle_error(error, debug=False)
-
-    captured = capsys.readouterr()
-    assert "❌ Database Error" in captured.out
-
-
-def test_handle_error_value_error(capsys: Any) -> None:
-    """Test handling ValueError."""
-    error = ValueError("Invalid input format")
-
-    handle_error(error, debug=False)
-
-    captured = capsys.readouterr()
-    assert "⚠️ Invalid Input" in captured.out
-
-
-def test_handle_error_generic_exception(capsys: Any) -> None:
-    """Test handling generic Exception."""
-    error = Exception("Something went wrong")
-
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        pytest.param(
+            RAGError("OpenAI API is unavailable"),
+            "❌ RAG System Error: OpenAI API is unavailable",
+            id="rag_error",
+        ),
+        pytest.param(
+            RateLimitError("Rate limit exceeded"), "⚠️ Rate Limit Exceeded", id="rate_limit"
+        ),
+        pytest.param(
+            DatabaseError("Database connection failed"), "❌ Database Error", id="database_error"
+        ),
+        pytest.param(ValueError("Invalid input format"), "⚠️ Invalid Input", id="value_error"),
+        pytest.param(
+            Exception("Something went wrong"), "❌ Unexpected Error", id="generic_exception"
+        ),
+    ],
+)
+def test_handle_error(error: Exception, expected: str, capsys: Any) -> None:
+    """Test each error type prints its user-facing message."""
     handle_error(error, debug=False)
 
     captured = capsys.readouterr()
-    assert "❌ Unexpected Error" in captured.out
+    assert expected in captured.out
 
 
 def test_handle_error_debug_mode(capsys: Any) -> None:
@@ -418,71 +400,53 @@ def test_handle_error_debug_mode(capsys: Any) -> None:
 # Test Conversation History Saving
 
 
-def test_save_conversation_history(sample_session: ConversationSession) -> None:
-    """Test saving conversation history to JSON."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = save_conversation_history(sample_session, save_dir=tmpdir)
-
-        # Verify file created
-        assert os.path.exists(filepath)
-        assert filepath.startswith(tmpdir)
-        assert "rag_conversation_" in filepath
-        assert filepath.endswith(".json")
-
-        # Verify JSON structure
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+def test_save_conversation_history(sample_session: ConversationSession, tmp_path: Path) -> None:
+    """Test saving history creates the directory, names the file, and round-trips unicode."""
+    sample_session.add_message("user", "What about もののけ姫?")
+    sample_session.add_message("assistant", "Princess Mononoke (もののけ姫) is a masterpiece!")
+    save_dir = tmp_path / "new_logs_dir"
 
-        assert "metadata" in data
-        assert "history" in data
-        assert "statistics" in data
+    # Directory should not exist yet; save creates it
+    assert not save_dir.exists()
 
-        # Verify metadata
-        assert data["metadata"]["total_queries"] == 1
-        assert data["metadata"]["total_tokens"] == 425
-        assert data["metadata"]["total_cost"] == 0.0127
+    filepath = save_conversation_history(sample_session, save_dir=str(save_dir))
 
-        # Verify history
-        assert len(data["history"]) == 2
-        assert data["history"][0]["role"] == "user"
-        assert data["history"][1]["role"] == "assistant"
+    # Verify directory and file created
+    assert save_dir.is_dir()
+    assert os.path.exists(filepath)
+    assert filepath.startswith(str(save_dir))
 
-        # Verify statistics
-        assert "session_duration_seconds" in data["statistics"]
-        assert "average_response_time" in data["statistics"]
-
-
-def test_save_conversation_history_creates_directory() -> None:
-    """Test conversation history saving creates directory if not exists."""
-    session = ConversationSession()
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        save_dir = os.path.join(tmpdir, "new_logs_dir")
-
-        # Directory should not exist
-        assert not os.path.exists(save_dir)
-
-        # Save should create directory
-        filepath = save_conversation_history(session, save_dir=save_dir)
-
-        # Verify directory created
-        assert os.path.exists(save_dir)
-        assert os.path.exists(filepath)
+    # Verify format: rag_conversation_YYYY-MM-DD_HH-MM-SS.json
+    assert re.fullmatch(
+        r"rag_conversation_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}\.json",
+        os.path.basename(filepath),
+    )
 
+    # Verify JSON structure
+    data = json.loads(Path(filepath).read_text(encoding="utf-8"))
 
-def test_save_conversation_history_filename_format() -> None:
-    """Test conversation history filename has correct timestamp format."""
-    session = ConversationSession()
+    assert "metadata" in data
+    assert "history" in data
+    assert "statistics" in data
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = save_conversation_history(session, save_dir=tmpdir)
+    # Verify metadata
+    assert data["metadata"]["total_queries"] == 1
+    assert data["metadata"]["total_tokens"] == 425
+    assert data["metadata"]["total_cost"] == 0.0127
 
-        filename = os.path.basename(filepath)
+    # Verify history, with unicode preserved
+    assert [message["role"] for message in data["history"]] == [
+        "user",
+        "assistant",
+        "user",
+        "assistant",
+    ]
+    assert "もののけ姫" in data["history"][2]["content"]
+    assert "もののけ姫" in data["history"][3]["content"]
 
-        # Verify format: rag_conversation_YYYY-MM-DD_HH-MM-SS.json
-        assert filename.startswith("rag_conversation_")
-        assert filename.endswith(".json")
-        assert len(filename) == len("rag_conversation_2025-01-08_14-30-45.json")
+    # Verify statistics
+    assert "session_duration_seconds" in data["statistics"]
+    assert "average_response_time" in data["statistics"]
 
 
 # Test Edge Cases
@@ -501,9 +465,8 @@ def test_conversation_session_stats_with_multiple_queries() -> None:
     assert 1.80 <= stats["average_response_time"] <= 1.82  # Allow float precision
 
 
-@patch("src.ai.rag_cli.query_rag_system")
 def test_process_query_with_chat_history(
-    mock_query: MagicMock, sample_rag_response: Dict[str, Any]
+    mock_query: MagicMock, sample_rag_response: Mapping[str, Any]
 ) -> None:
     """Test query processing includes chat history."""
     mock_query.return_value = sample_rag_response
@@ -527,7 +490,6 @@ def test_process_query_with_chat_history(
     assert session.history[0]["content"] == "Previous question"
 
 
-@patch("src.ai.rag_cli.query_rag_system")
 def test_process_query_missing_optional_fields(mock_query: MagicMock) -> None:
     """Test query processing handles missing optional fields in response."""
     # Response without tokens_used and cost
@@ -546,30 +508,22 @@ def test_process_query_missing_optional_fields(mock_query: MagicMock) -> None:
     assert session.total_cost == 0.0
 
 
-def test_handle_special_command_stats_formatting(capsys: Any) -> None:
+def test_handle_special_command_stats_formatting(
+    capsys: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test /stats command formats duration correctly."""
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz: Any = None) -> datetime:
+            return datetime(2024, 1, 1, 14, 15, 45)
+
+    monkeypatch.setattr("src.ai.rag_cli.datetime", FrozenDatetime)
     session = ConversationSession()
-    session.start_time = datetime.now() - timedelta(hours=2, minutes=15, seconds=45)
+    session.start_time = datetime(2024, 1, 1, 12, 0, 0)
     session.total_queries = 5
 
     handle_special_command("/stats", session)
 
     captured = capsys.readouterr()
     assert "2 hours 15 minutes 45 seconds" in captured.out
-
-
-def test_save_conversation_history_unicode_content() -> None:
-    """Test saving conversation with unicode characters."""
-    session = ConversationSession()
-    session.add_message("user", "What about もののけ姫?")
-    session.add_message("assistant", "Princess Mononoke (もののけ姫) is a masterpiece!")
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = save_conversation_history(session, save_dir=tmpdir)
-
-        # Verify unicode preserved
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        assert "もののけ姫" in data["history"][0]["content"]
-        assert "もののけ姫" in data["history"][1]["content"]
@@ -7,13 +7,6 @@ for the Streamlit validation dashboard.
 
 import pytest
 from unittest.mock import MagicMock, patch
-import sys
-from pathlib import Path
-
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
 
 
 @pytest.fixture